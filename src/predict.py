@@ -9,6 +9,7 @@ Updated to handle:
 """
 
 import os
+import warnings
 import joblib
 import numpy as np
 import pandas as pd
@@ -31,27 +32,39 @@ def load_model_and_encoders():
     return model, encoders, feature_names
 
 
-def preprocess_customer_data(customer_data, encoders=None, feature_names=None):
+def build_category_maps(encoders):
     """
-    Preprocess a single customer's data for prediction.
+    Build plain dict lookups for the LabelEncoded binary columns.
+
+    Returns:
+        {column: {category: code}} matching each encoder's transform()
+    """
+    return {
+        col: {category: code for code, category in enumerate(encoders[col].classes_)}
+        for col in encoders.get('_binary_cols', [])
+    }
+
+
+def encode_customer_row(customer_data, encoders, feature_names, category_maps=None):
+    """
+    Encode a single customer's data into unscaled feature values.
 
     Handles:
       - Feature engineering (num_services, avg_charge_per_month)
       - LabelEncoding for binary columns
       - OneHotEncoding for multi-class columns
-      - Correct feature ordering & scaling
+      - Correct feature ordering
 
     Args:
         customer_data: Dictionary with raw customer features
-        encoders:      Fitted encoders dict (loaded if None)
-        feature_names: Feature name list   (loaded if None)
+        encoders:      Fitted encoders dict
+        feature_names: Feature name list
+        category_maps: Optional build_category_maps() result, used
+                       instead of calling the LabelEncoders
 
     Returns:
-        Scaled numpy array ready for model.predict()
+        List of floats in feature_names order
     """
-    if encoders is None or feature_names is None:
-        _, encoders, feature_names = load_model_and_encoders()
-
     data = customer_data.copy()
 
     # ── Feature engineering ─────────────────────────────────────────
@@ -77,7 +90,10 @@ def preprocess_customer_data(customer_data, encoders=None, feature_names=None):
     binary_cols = encoders.get('_binary_cols', [])
     for col in binary_cols:
         if col in data and isinstance(data[col], str):
-            data[col] = encoders[col].transform([data[col]])[0]
+            if category_maps is not None:
+                data[col] = category_maps[col][data[col]]
+            else:
+                data[col] = encoders[col].transform([data[col]])[0]
 
     # ── Build feature vector ────────────────────────────────────────
     multi_cols = encoders.get('_multi_cols', [])
@@ -101,8 +117,28 @@ def preprocess_customer_data(customer_data, encoders=None, feature_names=None):
         else:
             row[fname] = 0.0  # default for unknown features
 
+    return [row[fname] for fname in feature_names]
+
+
+def preprocess_customer_data(customer_data, encoders=None, feature_names=None):
+    """
+    Preprocess a single customer's data for prediction.
+
+    Args:
+        customer_data: Dictionary with raw customer features
+        encoders:      Fitted encoders dict (loaded if None)
+        feature_names: Feature name list   (loaded if None)
+
+    Returns:
+        Scaled numpy array ready for model.predict()
+    """
+    if encoders is None or feature_names is None:
+        _, encoders, feature_names = load_model_and_encoders()
+
+    values = encode_customer_row(customer_data, encoders, feature_names)
+
     # Create feature array in correct order (as DataFrame to suppress sklearn warning)
-    features = pd.DataFrame([[row[fname] for fname in feature_names]], columns=feature_names)
+    features = pd.DataFrame([values], columns=feature_names)
 
     # Scale
     features_scaled = encoders['scaler'].transform(features)
@@ -110,28 +146,45 @@ def preprocess_customer_data(customer_data, encoders=None, feature_names=None):
     return features_scaled
 
 
-def predict_churn(customer_data, model=None, encoders=None, feature_names=None):
+def preprocess_into(out, customer_data, encoders, feature_names, category_maps=None):
     """
-    Predict churn probability for a customer.
+    Preprocess a single customer's data into a preallocated row.
 
-    Args:
-        customer_data: Dictionary with raw customer features
-        model / encoders / feature_names: optional, loaded if not provided
+    Same result as preprocess_customer_data(), but writes into ``out``
+    (shape ``(1, len(feature_names))``) and applies the StandardScaler
+    mean/scale in place instead of building a DataFrame.
 
     Returns:
-        Dictionary with prediction, probability, risk level
+        ``out``, ready for model.predict()
     """
-    if model is None or encoders is None or feature_names is None:
-        model, encoders, feature_names = load_model_and_encoders()
+    scaler = encoders['scaler']
+    out[0] = encode_customer_row(customer_data, encoders, feature_names, category_maps)
+    out -= scaler.mean_
+    out /= scaler.scale_
+    return out
 
-    features = preprocess_customer_data(customer_data, encoders, feature_names)
 
-    prediction = model.predict(features)[0]
+def predict_from_features(features, model):
+    """
+    Predict churn for an already preprocessed feature row.
 
-    if hasattr(model, 'predict_proba'):
-        churn_probability = model.predict_proba(features)[0][1]
-    else:
-        churn_probability = float(prediction)
+    Args:
+        features: Scaled array from preprocess_customer_data()
+        model:    Fitted classifier
+
+    Returns:
+        Dictionary with prediction, probability, risk level
+    """
+    # preprocess_into() rows are plain ndarrays already in feature_names
+    # order, so sklearn's feature-name check is noise here
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='X does not have valid feature names')
+        prediction = model.predict(features)[0]
+
+        if hasattr(model, 'predict_proba'):
+            churn_probability = model.predict_proba(features)[0][1]
+        else:
+            churn_probability = float(prediction)
 
     if churn_probability >= 0.7:
         risk_level = "HIGH"
@@ -149,6 +202,25 @@ def predict_churn(customer_data, model=None, encoders=None, feature_names=None):
     }
 
 
+def predict_churn(customer_data, model=None, encoders=None, feature_names=None):
+    """
+    Predict churn probability for a customer.
+
+    Args:
+        customer_data: Dictionary with raw customer features
+        model / encoders / feature_names: optional, loaded if not provided
+
+    Returns:
+        Dictionary with prediction, probability, risk level
+    """
+    if model is None or encoders is None or feature_names is None:
+        model, encoders, feature_names = load_model_and_encoders()
+
+    features = preprocess_customer_data(customer_data, encoders, feature_names)
+
+    return predict_from_features(features, model)
+
+
 def main():
     """Test prediction with sample customer data."""
     print("=" * 50)
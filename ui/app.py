@@ -13,6 +13,10 @@ import os
 ui_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, ui_dir)
 
+# Add src directory to path (predict / explain / recommend modules)
+src_dir = os.path.join(os.path.dirname(ui_dir), 'src')
+sys.path.insert(0, src_dir)
+
 from theme import COLORS, FONTS, SIZES
 from components.sidebar import Sidebar
 from pages.home import HomePage
@@ -3,4 +3,4 @@ Components package initialization.
 """
 
 from .sidebar import Sidebar
-from .widgets import AnimatedGauge, FeatureBarChart, Card, StatCard, ModernButton
+from .widgets import AnimatedGauge, FeatureBarChart, Card, StatCard, ModernButton, suspended_layout
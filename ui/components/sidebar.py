@@ -42,9 +42,8 @@ class Sidebar(tk.Frame):
         )
         version_label.pack(anchor=tk.W)
         
-        # Separator
-        separator = tk.Frame(self, bg=COLORS['border'], height=1)
-        separator.pack(fill=tk.X, padx=15, pady=10)
+        # Separator (1px canvas line)
+        self._create_divider(self).pack(fill=tk.X, padx=15, pady=10)
         
         # Navigation section header
         nav_header = tk.Label(
@@ -74,12 +73,15 @@ class Sidebar(tk.Frame):
         bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=20)
         
         # Separator
-        separator2 = tk.Frame(bottom_frame, bg=COLORS['border'], height=1)
-        separator2.pack(fill=tk.X, padx=15, pady=10)
+        self._create_divider(bottom_frame).pack(fill=tk.X, padx=15, pady=10)
         
         # Settings at bottom
         self.create_menu_item('settings', ICONS['settings'], 'Settings', parent=bottom_frame)
     
+    def _create_divider(self, parent):
+        """Create a 1px horizontal divider line."""
+        return tk.Canvas(parent, height=1, bg=COLORS['border'], highlightthickness=0, bd=0)
+    
     def create_menu_item(self, page_id, icon, label, parent=None):
         """Create a single menu item with hover effect."""
         container = parent if parent else self
@@ -89,21 +91,19 @@ class Sidebar(tk.Frame):
         bg_color = COLORS['sidebar_active'] if is_active else COLORS['sidebar_bg']
         fg_color = COLORS['text_primary'] if is_active else COLORS['text_secondary']
         
-        # Create frame for menu item
+        # Create frame for menu item (internal padding replaces an inner frame)
         item_frame = tk.Frame(
             container,
             bg=bg_color,
-            cursor='hand2'
+            cursor='hand2',
+            padx=10,
+            pady=10
         )
         item_frame.pack(fill=tk.X, padx=10, pady=2)
         
-        # Inner padding frame
-        inner_frame = tk.Frame(item_frame, bg=bg_color)
-        inner_frame.pack(fill=tk.X, padx=10, pady=10)
-        
         # Icon
         icon_label = tk.Label(
-            inner_frame,
+            item_frame,
             text=icon,
             font=('Segoe UI', 14),
             bg=bg_color,
@@ -113,7 +113,7 @@ class Sidebar(tk.Frame):
         
         # Label
         text_label = tk.Label(
-            inner_frame,
+            item_frame,
             text=label,
             font=FONTS['sidebar_item_active'] if is_active else FONTS['sidebar_item'],
             bg=bg_color,
@@ -121,40 +121,45 @@ class Sidebar(tk.Frame):
         )
         text_label.pack(side=tk.LEFT, padx=(10, 0))
         
-        # Store reference
-        self.menu_items.append({
+        # Store reference (with the currently applied colors/font state)
+        item = {
             'id': page_id,
             'frame': item_frame,
-            'inner': inner_frame,
             'icon': icon_label,
-            'text': text_label
-        })
+            'text': text_label,
+            '_bg': bg_color,
+            '_active': is_active
+        }
+        self.menu_items.append(item)
         
         # Bind hover effects
-        def on_enter(e, f=item_frame, i=inner_frame, il=icon_label, tl=text_label):
+        def on_enter(e, it=item):
             if page_id != self.current_page:
-                f.config(bg=COLORS['sidebar_hover'])
-                i.config(bg=COLORS['sidebar_hover'])
-                il.config(bg=COLORS['sidebar_hover'])
-                tl.config(bg=COLORS['sidebar_hover'])
+                self._set_item_bg(it, COLORS['sidebar_hover'])
         
-        def on_leave(e, f=item_frame, i=inner_frame, il=icon_label, tl=text_label):
+        def on_leave(e, it=item):
             if page_id != self.current_page:
-                f.config(bg=COLORS['sidebar_bg'])
-                i.config(bg=COLORS['sidebar_bg'])
-                il.config(bg=COLORS['sidebar_bg'])
-                tl.config(bg=COLORS['sidebar_bg'])
+                self._set_item_bg(it, COLORS['sidebar_bg'])
         
         def on_click(e, pid=page_id):
             self.set_active(pid)
             self.on_page_change(pid)
         
         # Bind to all elements
-        for widget in [item_frame, inner_frame, icon_label, text_label]:
+        for widget in [item_frame, icon_label, text_label]:
             widget.bind('<Enter>', on_enter)
             widget.bind('<Leave>', on_leave)
             widget.bind('<Button-1>', on_click)
     
+    def _set_item_bg(self, item, bg_color):
+        """Recolor a menu item's background, skipping no-op changes."""
+        if item['_bg'] == bg_color:
+            return
+        item['_bg'] = bg_color
+        item['frame'].config(bg=bg_color)
+        item['icon'].config(bg=bg_color)
+        item['text'].config(bg=bg_color)
+    
     def set_active(self, page_id):
         """Set the active menu item."""
         self.current_page = page_id
@@ -162,13 +167,15 @@ class Sidebar(tk.Frame):
         for item in self.menu_items:
             is_active = item['id'] == page_id
             bg_color = COLORS['sidebar_active'] if is_active else COLORS['sidebar_bg']
-            fg_color = COLORS['text_primary'] if is_active else COLORS['text_secondary']
+            self._set_item_bg(item, bg_color)
             
-            item['frame'].config(bg=bg_color)
-            item['inner'].config(bg=bg_color)
-            item['icon'].config(bg=bg_color, fg=fg_color)
-            item['text'].config(
-                bg=bg_color, 
-                fg=fg_color,
-                font=FONTS['sidebar_item_active'] if is_active else FONTS['sidebar_item']
-            )
+            # Foreground and font only change with the active state; font
+            # changes are expensive as they force a metrics recomputation
+            if item['_active'] != is_active:
+                item['_active'] = is_active
+                fg_color = COLORS['text_primary'] if is_active else COLORS['text_secondary']
+                item['icon'].config(fg=fg_color)
+                item['text'].config(
+                    fg=fg_color,
+                    font=FONTS['sidebar_item_active'] if is_active else FONTS['sidebar_item']
+                )
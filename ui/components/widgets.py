@@ -5,9 +5,46 @@ Reusable UI components for the application.
 
 import tkinter as tk
 from tkinter import ttk
+from collections import OrderedDict
+from contextlib import contextmanager
 import math
 
 
+@contextmanager
+def suspended_layout(widget):
+    """Detach a packed widget while its children are built, then re-pack it.
+    
+    Children packed into an unmapped widget don't trigger re-layout of the
+    visible tree, so a batch of pack() calls collapses into one geometry pass
+    when the widget is restored. Widgets not yet packed are left alone.
+    """
+    if widget.winfo_manager() != 'pack':
+        yield widget
+        return
+    
+    info = widget.pack_info()
+    master = info.pop('in')
+    siblings = master.pack_slaves()
+    index = siblings.index(widget)
+    # Anchor to the previous sibling, or the next one if widget comes first
+    if index > 0:
+        position = {'after': siblings[index - 1]}
+    elif len(siblings) > 1:
+        position = {'before': siblings[1]}
+    else:
+        position = {}
+    
+    widget.pack_forget()
+    try:
+        yield widget
+    finally:
+        anchor = next(iter(position.values()), None)
+        if anchor is not None and anchor.winfo_manager() == 'pack':
+            widget.pack(in_=master, **position, **info)
+        else:
+            widget.pack(in_=master, **info)
+
+
 class AnimatedGauge(tk.Canvas):
     """Animated circular gauge for displaying percentages."""
     
@@ -31,6 +68,15 @@ class AnimatedGauge(tk.Canvas):
             'label': '#8b949e'
         }
         
+        # Arc geometry and risk levels never change after construction
+        self._bbox = (20, 20, size - 20, size - 20)
+        self._extent_scale = 270.0 / 100.0
+        self._levels = (
+            (self.colors['low'], "LOW RISK"),
+            (self.colors['medium'], "MODERATE"),
+            (self.colors['high'], "HIGH RISK"),
+        )
+        
         self.draw_gauge(0)
     
     def draw_gauge(self, value):
@@ -39,28 +85,20 @@ class AnimatedGauge(tk.Canvas):
         
         # Background arc (track)
         self.create_arc(
-            20, 20, self.size - 20, self.size - 20,
+            *self._bbox,
             start=135, extent=270,
             style=tk.ARC, width=12,
             outline=self.colors['track']
         )
         
-        # Determine color based on value
-        if value >= 70:
-            color = self.colors['high']
-            label = "HIGH RISK"
-        elif value >= 40:
-            color = self.colors['medium']
-            label = "MODERATE"
-        else:
-            color = self.colors['low']
-            label = "LOW RISK"
+        # Determine color based on value (0 = low, 1 = moderate, 2 = high)
+        color, label = self._levels[(value >= 40) + (value >= 70)]
         
         # Value arc
-        extent = (value / 100) * 270
+        extent = value * self._extent_scale
         if extent > 0:
             self.create_arc(
-                20, 20, self.size - 20, self.size - 20,
+                *self._bbox,
                 start=135, extent=-extent,
                 style=tk.ARC, width=12,
                 outline=color
@@ -116,6 +154,12 @@ class AnimatedGauge(tk.Canvas):
 class FeatureBarChart(tk.Canvas):
     """Horizontal bar chart for feature importance - Enhanced version."""
     
+    # Max number of pre-rendered bar images kept alive
+    BAR_CACHE_SIZE = 32
+    
+    # Max number of bars that fit the chart
+    MAX_BARS = 8
+    
     def __init__(self, parent, width=420, height=320, colors=None, **kwargs):
         bg_color = colors.get('bg', '#1c2128') if colors else '#1c2128'
         super().__init__(parent, width=width, height=height,
@@ -130,6 +174,7 @@ class FeatureBarChart(tk.Canvas):
             'label': '#8b949e',
             'line': '#30363d'
         }
+        self._bar_cache = OrderedDict()
         
         # Draw empty state
         self.draw_empty()
@@ -159,7 +204,7 @@ class FeatureBarChart(tk.Canvas):
         padding_right = 60
         
         available_height = self.chart_height - padding_top - padding_bottom
-        num_features = min(len(features), 8)
+        num_features = min(len(features), self.MAX_BARS)
         bar_height = min(28, (available_height - (num_features - 1) * 6) // num_features)
         bar_spacing = 6
         
@@ -286,13 +331,31 @@ class FeatureBarChart(tk.Canvas):
             self.create_rectangle(x1, y1, x2, y2, fill=color, outline='')
             return
         
-        # Create rounded rectangle with arcs and rectangles
-        self.create_rectangle(x1 + radius, y1, x2 - radius, y2, fill=color, outline='')
-        self.create_rectangle(x1, y1 + radius, x2, y2 - radius, fill=color, outline='')
-        self.create_oval(x1, y1, x1 + radius * 2, y1 + radius * 2, fill=color, outline='')
-        self.create_oval(x2 - radius * 2, y1, x2, y1 + radius * 2, fill=color, outline='')
-        self.create_oval(x1, y2 - radius * 2, x1 + radius * 2, y2, fill=color, outline='')
-        self.create_oval(x2 - radius * 2, y2 - radius * 2, x2, y2, fill=color, outline='')
+        # Stamp a cached pre-rendered bar instead of 6 rectangles/ovals
+        image = self._get_bar_image(int(round(width)), int(round(y2 - y1)), int(radius), color)
+        self.create_image(int(round(x1)), int(round(y1)), anchor=tk.NW, image=image)
+    
+    def _get_bar_image(self, width, height, radius, color):
+        """Return a rounded bar PhotoImage, rendering it on first use."""
+        key = (width, height, radius, color)
+        image = self._bar_cache.get(key)
+        if image is not None:
+            self._bar_cache.move_to_end(key)
+            return image
+        
+        # Fill row by row, insetting the rows that fall inside a corner;
+        # pixels never written stay transparent
+        image = tk.PhotoImage(master=self, width=width, height=height)
+        for y in range(height):
+            dy = max(radius - y - 0.5, y + 0.5 - (height - radius), 0)
+            inset = int(round(radius - math.sqrt(max(radius * radius - dy * dy, 0)))) if dy else 0
+            if inset * 2 < width:
+                image.put(color, to=(inset, y, width - inset, y + 1))
+        
+        self._bar_cache[key] = image
+        if len(self._bar_cache) > self.BAR_CACHE_SIZE:
+            self._bar_cache.popitem(last=False)
+        return image
 
 
 class Card(tk.Frame):
@@ -392,77 +455,149 @@ class StatCard(tk.Frame):
             self.value_label.config(fg=color)
 
 
-class ModernButton(tk.Button):
-    """Modern styled button with hover effects."""
+class ModernButton(tk.Label):
+    """Modern styled button with hover effects.
+    
+    Drawn as a flat ``tk.Label`` with mouse bindings rather than a native
+    ``tk.Button``, which is slow to reconfigure on Windows and whose native
+    visuals are all overridden here anyway.
+    """
     
     def __init__(self, parent, text, command=None, style='primary', icon="", colors=None, **kwargs):
         # Map colors from theme
         if colors:
             primary = colors.get('accent', colors.get('primary', '#58a6ff'))
             primary_hover = colors.get('accent_hover', colors.get('primary_hover', '#79b8ff'))
+            primary_pressed = colors.get('accent_dark', colors.get('primary_pressed', '#1f6feb'))
             secondary = colors.get('bg_light', colors.get('secondary', '#21262d'))
             secondary_hover = colors.get('sidebar_hover', colors.get('secondary_hover', '#30363d'))
+            secondary_pressed = colors.get('border', colors.get('secondary_pressed', '#30363d'))
             danger = colors.get('danger', '#f85149')
             danger_hover = colors.get('danger_light', colors.get('danger_hover', '#ff7b72'))
             success = colors.get('success', '#3fb950')
             success_hover = colors.get('success_light', colors.get('success_hover', '#56d364'))
             text_color = colors.get('text_primary', colors.get('text', '#ffffff'))
+            disabled_color = colors.get('text_muted', colors.get('disabled', '#6e7681'))
         else:
             primary = '#58a6ff'
             primary_hover = '#79b8ff'
+            primary_pressed = '#1f6feb'
             secondary = '#21262d'
             secondary_hover = '#30363d'
+            secondary_pressed = '#30363d'
             danger = '#f85149'
             danger_hover = '#ff7b72'
             success = '#3fb950'
             success_hover = '#56d364'
             text_color = '#ffffff'
+            disabled_color = '#6e7681'
         
         # Determine colors based on style
         if style == 'primary':
             bg = primary
             bg_hover = primary_hover
+            bg_pressed = primary_pressed
             fg = text_color
         elif style == 'danger':
             bg = danger
             bg_hover = danger_hover
+            bg_pressed = danger
             fg = text_color
         elif style == 'success':
             bg = success
             bg_hover = success_hover
+            bg_pressed = success
             fg = text_color
         else:  # secondary
             bg = secondary
             bg_hover = secondary_hover
+            bg_pressed = secondary_pressed
             fg = text_color
         
         self.bg_normal = bg
         self.bg_hover = bg_hover
+        self.bg_pressed = bg_pressed
+        self.command = command
+        # Pointer-over and keyboard focus, either of which shows the hover color
+        self._hovered = False
+        self._focused = False
         
         button_text = f"{icon}  {text}" if icon else text
         
+        # Labels skip Tab traversal by default; buttons don't
+        kwargs.setdefault('takefocus', 1)
+        
         super().__init__(
             parent,
             text=button_text,
-            command=command,
             bg=bg,
             fg=fg,
-            activebackground=bg_hover,
-            activeforeground=fg,
+            disabledforeground=disabled_color,
             font=('Segoe UI', 10, 'bold'),
-            relief=tk.FLAT,
             cursor='hand2',
             padx=20,
             pady=10,
             **kwargs
         )
         
-        # Bind hover effects
+        # Bind hover and press effects
         self.bind('<Enter>', self._on_enter)
         self.bind('<Leave>', self._on_leave)
+        self.bind('<Button-1>', self._on_press)
+        self.bind('<ButtonRelease-1>', self._on_release)
+        
+        # Keyboard activation, shown with the hover color while focused
+        self.bind('<space>', self._on_key)
+        self.bind('<Return>', self._on_key)
+        self.bind('<FocusIn>', self._on_focus_in)
+        self.bind('<FocusOut>', self._on_focus_out)
+    
+    def _is_enabled(self):
+        return str(self.cget('state')) != tk.DISABLED
+    
+    def invoke(self):
+        """Run the button command, as ``tk.Button.invoke`` would."""
+        if self.command and self._is_enabled():
+            return self.command()
+    
+    def _recolor(self):
+        """Show the hover color while hovered or focused, if enabled."""
+        active = self._is_enabled() and (self._hovered or self._focused)
+        self.config(bg=self.bg_hover if active else self.bg_normal)
     
     def _on_enter(self, e):
-        self.config(bg=self.bg_hover)
+        self._hovered = True
+        if not self._is_enabled():
+            return
+        self._recolor()
     
     def _on_leave(self, e):
-        self.config(bg=self.bg_normal)
+        self._hovered = False
+        self._recolor()
+    
+    def _on_focus_in(self, e):
+        self._focused = True
+        self._recolor()
+    
+    def _on_focus_out(self, e):
+        self._focused = False
+        self._recolor()
+    
+    def _on_press(self, e):
+        if not self._is_enabled():
+            return
+        self.config(bg=self.bg_pressed)
+    
+    def _on_key(self, e):
+        self.invoke()
+        return 'break'
+    
+    def _on_release(self, e):
+        if not self._is_enabled():
+            return
+        # Only fire when released over the button, like a native button
+        inside = 0 <= e.x < self.winfo_width() and 0 <= e.y < self.winfo_height()
+        self._hovered = inside
+        self._recolor()
+        if inside:
+            self.invoke()
@@ -5,12 +5,8 @@ Common functionality for all pages with scrollable content.
 
 import tkinter as tk
 from tkinter import ttk
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from theme import COLORS, FONTS
+from components.widgets import suspended_layout
 
 
 class ScrollableFrame(tk.Frame):
@@ -40,10 +36,8 @@ class ScrollableFrame(tk.Frame):
         )
         
         # Configure canvas scrolling
-        self.inner_frame.bind(
-            '<Configure>',
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all'))
-        )
+        self._scrollregion_pending = None
+        self.inner_frame.bind('<Configure>', self._on_frame_configure)
         
         # Create window in canvas
         self.canvas_window = self.canvas.create_window(
@@ -66,6 +60,20 @@ class ScrollableFrame(tk.Frame):
         self.inner_frame.bind('<Enter>', self._bind_mousewheel)
         self.inner_frame.bind('<Leave>', self._unbind_mousewheel)
     
+    def _on_frame_configure(self, event):
+        """Coalesce inner frame resizes into one scrollregion update."""
+        if self._scrollregion_pending is None:
+            self._scrollregion_pending = self.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Set scrollregion from the inner frame's requested size."""
+        self._scrollregion_pending = None
+        self.canvas.configure(scrollregion=(
+            0, 0,
+            self.inner_frame.winfo_reqwidth(),
+            self.inner_frame.winfo_reqheight()
+        ))
+    
     def _on_canvas_configure(self, event):
         """Update inner frame width when canvas resizes."""
         self.canvas.itemconfig(self.canvas_window, width=event.width)
@@ -104,22 +112,27 @@ class BasePage(tk.Frame):
         header = tk.Frame(self.content, bg=self.colors['bg_medium'])
         header.pack(fill=tk.X, padx=30, pady=(25, 20))
         
-        tk.Label(
-            header,
-            text=title,
-            font=self.fonts['title'],
-            bg=self.colors['bg_medium'],
-            fg=self.colors['text_primary']
-        ).pack(anchor=tk.W)
+        # Subtitle label, kept so pages can update the text later
+        self.header_subtitle = None
         
-        if subtitle:
+        with suspended_layout(header):
             tk.Label(
                 header,
-                text=subtitle,
-                font=self.fonts['body'],
+                text=title,
+                font=self.fonts['title'],
                 bg=self.colors['bg_medium'],
-                fg=self.colors['text_secondary']
-            ).pack(anchor=tk.W, pady=(5, 0))
+                fg=self.colors['text_primary']
+            ).pack(anchor=tk.W)
+            
+            if subtitle:
+                self.header_subtitle = tk.Label(
+                    header,
+                    text=subtitle,
+                    font=self.fonts['body'],
+                    bg=self.colors['bg_medium'],
+                    fg=self.colors['text_secondary']
+                )
+                self.header_subtitle.pack(anchor=tk.W, pady=(5, 0))
         
         return header
     
@@ -3,14 +3,164 @@ Charts/Analytics Page
 Model training info, performance metrics, and algorithm comparison.
 """
 
+from dataclasses import dataclass, field
+from typing import Optional
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 from .base import BasePage
-import sys
-import os
+from theme import COLORS, FONTS
+from components.widgets import suspended_layout
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from theme import COLORS, FONTS, ICONS
+
+# Color thresholds per metric: (minimum value, color key) pairs checked in
+# order, with the last color used as the fallback
+_METRIC_THRESHOLDS = {
+    'accuracy': ((70, 'success'), (None, 'warning')),
+    'precision': ((60, 'success'), (None, 'warning')),
+    'recall': ((85, 'success'), (35, 'warning'), (None, 'danger')),
+    'f1_score': ((None, 'accent'),),
+    'roc_auc': ((83, 'success'), (None, 'warning')),
+}
+
+
+# Performance section rows: (display name, AlgoMetrics field)
+_METRIC_FIELDS = (
+    ("Accuracy", 'accuracy'),
+    ("Precision", 'precision'),
+    ("Recall", 'recall'),
+    ("F1-Score", 'f1_score'),
+    ("ROC-AUC", 'roc_auc'),
+)
+
+# Static header cells of the 3x3 confusion matrix, keyed by (row, col)
+_CM_HEADERS = {
+    (0, 0): "", (0, 1): "Predicted\nStay", (0, 2): "Predicted\nChurn",
+    (1, 0): "Actual Stay", (2, 0): "Actual Churn",
+}
+
+# Comparison table columns: (column id, heading, width in px)
+_COMPARISON_HEADERS = (
+    ('model', "Model", 170), ('roc_auc', "ROC-AUC", 80), ('recall', "Recall", 75),
+    ('f1_score', "F1", 55), ('roi', "ROI $", 100), ('p_value', "p-val", 85),
+)
+
+# Comparison table targets: a cell at or above its minimum is marked ✓
+_COMPARISON_TARGETS = {'roc_auc': 83, 'recall': 80, 'roi': 120000}
+
+# Treeview data columns (the model name lives in the tree column #0)
+_COMPARISON_COLUMNS = tuple(col for col, _, _ in _COMPARISON_HEADERS[1:])
+
+_BULLET = "  • "
+
+
+# Font objects keyed by their FONTS spec, created on first use (a Tk root
+# must exist) so every widget and canvas item shares one named font
+_FONT_CACHE = {}
+
+
+def _font(spec):
+    """Return the shared tkfont.Font for a font spec tuple."""
+    font = _FONT_CACHE.get(spec)
+    if font is None:
+        font = _FONT_CACHE[spec] = tkfont.Font(font=spec)
+    return font
+
+
+def _cm_cell_boxes(cell_w, cell_h, gap):
+    """Return (row, col, rectangle coords, text center) for each 3x3 matrix cell."""
+    boxes = []
+    for i in range(3):
+        for j in range(3):
+            x = gap + j * (cell_w + gap)
+            y = gap + i * (cell_h + gap)
+            boxes.append((i, j, (x, y, x + cell_w, y + cell_h), (x + cell_w // 2, y + cell_h // 2)))
+    return tuple(boxes)
+
+
+def _metric_color_key(metric, value):
+    """Return the COLORS key for a metric value."""
+    for threshold, color_key in _METRIC_THRESHOLDS[metric]:
+        if threshold is None or value >= threshold:
+            return color_key
+
+
+@dataclass(frozen=True)
+class AlgoMetrics:
+    """Static metrics of one trained model, plus its precomputed display strings."""
+    name: str
+    accuracy: float
+    precision: float
+    recall: float
+    f1_score: float
+    roc_auc: float
+    confusion_matrix: tuple
+    is_best: bool
+    roi: int
+    wilcoxon_p: Optional[float]
+    description: str
+    strengths: tuple
+    weaknesses: tuple
+    why_chosen: str = ''
+    why_not: str = ''
+    
+    # Derived in __post_init__
+    colored_metrics: tuple = field(init=False, repr=False)
+    perf_title: str = field(init=False, repr=False)
+    selector_metric: str = field(init=False, repr=False)
+    comparison_name: str = field(init=False, repr=False)
+    comparison_values: tuple = field(init=False, repr=False)
+    cm_strings: tuple = field(init=False, repr=False)
+    correct_summary: str = field(init=False, repr=False)
+    strengths_text: str = field(init=False, repr=False)
+    weaknesses_text: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Attach the (static) metric color keys and display strings."""
+        object.__setattr__(self, 'colored_metrics', tuple(
+            (label, getattr(self, name), f"{getattr(self, name):.1f}%",
+             _metric_color_key(name, getattr(self, name)))
+            for label, name in _METRIC_FIELDS
+        ))
+        
+        # Label texts
+        object.__setattr__(self, 'perf_title', f"📈  {self.name} Performance")
+        object.__setattr__(self, 'selector_metric', f"ROC-AUC: {self.roc_auc:.1f}%")
+        object.__setattr__(self, 'comparison_name', f"⭐ {self.name}" if self.is_best else f"   {self.name}")
+        
+        # Comparison table cells, marked ✓ where they meet their target, with
+        # the Wilcoxon p-value against the best
+        def mark(name, text):
+            return f"{text} ✓" if getattr(self, name) >= _COMPARISON_TARGETS[name] else text
+        
+        p_val = self.wilcoxon_p
+        if p_val is None:
+            p_text = "Baseline ⭐"
+        elif p_val < 0.05:
+            p_text = f"{p_val:.3f} ✓"
+        else:
+            p_text = f"{p_val:.3f}"
+        object.__setattr__(self, 'comparison_values', (
+            mark('roc_auc', f"{self.roc_auc:.1f}%"),
+            mark('recall', f"{self.recall:.1f}%"),
+            f"{self.f1_score:.1f}%",
+            mark('roi', f"${self.roi:,}"),
+            p_text,
+        ))
+        
+        # Confusion matrix cell texts as ((row, col), text) pairs in the 3x3
+        # grid; a tuple keeps the frozen dataclass hashable
+        (tn, fp), (fn, tp) = self.confusion_matrix
+        object.__setattr__(self, 'cm_strings', (
+            ((1, 1), str(tn)), ((1, 2), str(fp)), ((2, 1), str(fn)), ((2, 2), str(tp)),
+        ))
+        total = tn + fp + fn + tp
+        correct = tn + tp
+        object.__setattr__(self, 'correct_summary', f"\nCorrect predictions: {correct}/{total} ({correct/total*100:.1f}%)")
+        
+        # Bullet lists, one line per item
+        object.__setattr__(self, 'strengths_text', "\n".join(_BULLET + item for item in self.strengths))
+        object.__setattr__(self, 'weaknesses_text', "\n".join(_BULLET + item for item in self.weaknesses))
 
 
 class ChartsPage(BasePage):
@@ -20,115 +170,152 @@ class ChartsPage(BasePage):
     # Enhanced pipeline: SMOTE (inside CV), OneHot encoding, class balancing,
     # hyperparameter tuning, feature engineering (num_services, avg_charge, tenure_group)
     ALGORITHMS = {
-        'xgboost': {
-            'name': 'XGBoost',
-            'accuracy': 68.35,
-            'precision': 45.20,
-            'recall': 90.64,
-            'f1_score': 60.32,
-            'roc_auc': 84.31,
-            'confusion_matrix': [[624, 411], [35, 339]],
-            'is_best': True,
-            'roi': 132000,
-            'wilcoxon_p': None,
-            'description': 'Extreme Gradient Boosting with SMOTE oversampling (applied correctly inside CV folds). Achieves the best ROC-AUC on the Telco dataset with outstanding recall — catches over 90% of actual churners.',
-            'strengths': ['Best ROC-AUC (0.8431)', 'Highest recall (90.64%) — catches most churners', 'CV ROC-AUC: 0.8461 ± 0.011', 'SMOTE applied inside CV — no data leakage', 'L1/L2 regularization prevents overfitting', 'Best ROI ($132,000) — highest business value'],
-            'weaknesses': ['Lower precision (45.20%) — more false positives', 'Accuracy lower due to aggressive churn detection', 'Less interpretable than Logistic Regression'],
-            'why_chosen': 'Selected as the best model due to highest ROC-AUC (0.8431) with outstanding recall (90.64%). Statistically validated via Wilcoxon Signed-Rank Test. For churn prediction, missing fewer churners is critical — this model catches 9 out of 10 actual churners.',
-        },
-        'gradient_boosting': {
-            'name': 'Gradient Boosting',
-            'accuracy': 77.29,
-            'precision': 55.63,
-            'recall': 71.39,
-            'f1_score': 62.53,
-            'roc_auc': 84.14,
-            'confusion_matrix': [[753, 282], [107, 267]],
-            'is_best': False,
-            'roi': 109500,
-            'wilcoxon_p': 0.3125,
-            'description': 'A sequential ensemble method that builds trees to correct previous errors. Good balance between precision and recall with strong ROC-AUC.',
-            'strengths': ['Highest accuracy (77.29%)', 'Best precision (55.63%)', 'CV ROC-AUC: 0.8463 ± 0.012', 'Good precision-recall balance'],
-            'weaknesses': ['Lower recall than XGBoost (71.39% vs 90.64%)', 'Misses ~29% of actual churners', 'Slower training than linear models'],
-            'why_not': 'Strong contender with best accuracy but lower ROC-AUC (0.8414 vs 0.8431) and significantly lower recall than XGBoost.',
-        },
-        'random_forest': {
-            'name': 'Random Forest',
-            'accuracy': 75.37,
-            'precision': 52.43,
-            'recall': 77.81,
-            'f1_score': 62.65,
-            'roc_auc': 84.08,
-            'confusion_matrix': [[752, 283], [83, 291]],
-            'is_best': False,
-            'roi': 117750,
-            'wilcoxon_p': 0.0244,
-            'description': 'An ensemble of balanced decision trees with tuned depth. With SMOTE and class balancing, achieves good recall while maintaining decent precision.',
-            'strengths': ['Best F1-score (62.65%)', 'Good recall (77.81%)', 'CV ROC-AUC: 0.8449 ± 0.010', 'Robust to overfitting'],
-            'weaknesses': ['Lower ROC-AUC than top models', 'Slower training', 'Less interpretable'],
-            'why_not': 'Good balance of precision and recall but lower ROC-AUC (0.8408) than XGBoost.',
-        },
-        'logistic': {
-            'name': 'Logistic Regression',
-            'accuracy': 73.53,
-            'precision': 50.09,
-            'recall': 78.34,
-            'f1_score': 61.11,
-            'roc_auc': 83.98,
-            'confusion_matrix': [[746, 289], [81, 293]],
-            'is_best': False,
-            'roi': 117250,
-            'wilcoxon_p': 0.2783,
-            'description': 'A linear model with class_weight=balanced and L1 regularization. Enhanced with SMOTE inside CV, it catches 78% of churners with interpretable coefficients.',
-            'strengths': ['Good recall (78.34%)', 'CV ROC-AUC: 0.8449 ± 0.012', 'Fast training and inference', 'Interpretable coefficients'],
-            'weaknesses': ['Lower precision (50.09%)', 'Assumes linear feature relationships'],
-            'why_not': 'Strong contender but lower ROC-AUC than XGBoost (0.8398 vs 0.8431).',
-        },
-        'naive_bayes': {
-            'name': 'Naive Bayes',
-            'accuracy': 70.19,
-            'precision': 46.55,
-            'recall': 82.89,
-            'f1_score': 59.62,
-            'roc_auc': 81.27,
-            'confusion_matrix': [[658, 377], [64, 310]],
-            'is_best': False,
-            'roi': 121700,
-            'wilcoxon_p': 0.001,
-            'description': 'A probabilistic classifier with tuned var_smoothing. Good recall but lowest overall discrimination ability (ROC-AUC).',
-            'strengths': ['High recall (82.89%)', 'Very fast training', 'Simple and interpretable', 'Useful as a baseline'],
-            'weaknesses': ['Lowest ROC-AUC (0.8127)', 'Lower precision (46.55%)', 'Assumes feature independence'],
-            'why_not': 'Good recall but substantially lower ROC-AUC (0.8127) — weakest overall discrimination between churners and stayers.',
-        }
+        'xgboost': AlgoMetrics(
+            name='XGBoost',
+            accuracy=68.35,
+            precision=45.20,
+            recall=90.64,
+            f1_score=60.32,
+            roc_auc=84.31,
+            confusion_matrix=((624, 411), (35, 339)),
+            is_best=True,
+            roi=132000,
+            wilcoxon_p=None,
+            description='Extreme Gradient Boosting with SMOTE oversampling (applied correctly inside CV folds). Achieves the best ROC-AUC on the Telco dataset with outstanding recall — catches over 90% of actual churners.',
+            strengths=('Best ROC-AUC (0.8431)', 'Highest recall (90.64%) — catches most churners', 'CV ROC-AUC: 0.8461 ± 0.011', 'SMOTE applied inside CV — no data leakage', 'L1/L2 regularization prevents overfitting', 'Best ROI ($132,000) — highest business value'),
+            weaknesses=('Lower precision (45.20%) — more false positives', 'Accuracy lower due to aggressive churn detection', 'Less interpretable than Logistic Regression'),
+            why_chosen='Selected as the best model due to highest ROC-AUC (0.8431) with outstanding recall (90.64%). Statistically validated via Wilcoxon Signed-Rank Test. For churn prediction, missing fewer churners is critical — this model catches 9 out of 10 actual churners.',
+        ),
+        'gradient_boosting': AlgoMetrics(
+            name='Gradient Boosting',
+            accuracy=77.29,
+            precision=55.63,
+            recall=71.39,
+            f1_score=62.53,
+            roc_auc=84.14,
+            confusion_matrix=((753, 282), (107, 267)),
+            is_best=False,
+            roi=109500,
+            wilcoxon_p=0.3125,
+            description='A sequential ensemble method that builds trees to correct previous errors. Good balance between precision and recall with strong ROC-AUC.',
+            strengths=('Highest accuracy (77.29%)', 'Best precision (55.63%)', 'CV ROC-AUC: 0.8463 ± 0.012', 'Good precision-recall balance'),
+            weaknesses=('Lower recall than XGBoost (71.39% vs 90.64%)', 'Misses ~29% of actual churners', 'Slower training than linear models'),
+            why_not='Strong contender with best accuracy but lower ROC-AUC (0.8414 vs 0.8431) and significantly lower recall than XGBoost.',
+        ),
+        'random_forest': AlgoMetrics(
+            name='Random Forest',
+            accuracy=75.37,
+            precision=52.43,
+            recall=77.81,
+            f1_score=62.65,
+            roc_auc=84.08,
+            confusion_matrix=((752, 283), (83, 291)),
+            is_best=False,
+            roi=117750,
+            wilcoxon_p=0.0244,
+            description='An ensemble of balanced decision trees with tuned depth. With SMOTE and class balancing, achieves good recall while maintaining decent precision.',
+            strengths=('Best F1-score (62.65%)', 'Good recall (77.81%)', 'CV ROC-AUC: 0.8449 ± 0.010', 'Robust to overfitting'),
+            weaknesses=('Lower ROC-AUC than top models', 'Slower training', 'Less interpretable'),
+            why_not='Good balance of precision and recall but lower ROC-AUC (0.8408) than XGBoost.',
+        ),
+        'logistic': AlgoMetrics(
+            name='Logistic Regression',
+            accuracy=73.53,
+            precision=50.09,
+            recall=78.34,
+            f1_score=61.11,
+            roc_auc=83.98,
+            confusion_matrix=((746, 289), (81, 293)),
+            is_best=False,
+            roi=117250,
+            wilcoxon_p=0.2783,
+            description='A linear model with class_weight=balanced and L1 regularization. Enhanced with SMOTE inside CV, it catches 78% of churners with interpretable coefficients.',
+            strengths=('Good recall (78.34%)', 'CV ROC-AUC: 0.8449 ± 0.012', 'Fast training and inference', 'Interpretable coefficients'),
+            weaknesses=('Lower precision (50.09%)', 'Assumes linear feature relationships'),
+            why_not='Strong contender but lower ROC-AUC than XGBoost (0.8398 vs 0.8431).',
+        ),
+        'naive_bayes': AlgoMetrics(
+            name='Naive Bayes',
+            accuracy=70.19,
+            precision=46.55,
+            recall=82.89,
+            f1_score=59.62,
+            roc_auc=81.27,
+            confusion_matrix=((658, 377), (64, 310)),
+            is_best=False,
+            roi=121700,
+            wilcoxon_p=0.001,
+            description='A probabilistic classifier with tuned var_smoothing. Good recall but lowest overall discrimination ability (ROC-AUC).',
+            strengths=('High recall (82.89%)', 'Very fast training', 'Simple and interpretable', 'Useful as a baseline'),
+            weaknesses=('Lowest ROC-AUC (0.8127)', 'Lower precision (46.55%)', 'Assumes feature independence'),
+            why_not='Good recall but substantially lower ROC-AUC (0.8127) — weakest overall discrimination between churners and stayers.',
+        ),
     }
     
+    # Confusion matrix cell size (px)
+    CM_CELL_WIDTH = 110
+    CM_CELL_HEIGHT = 44
+    CM_GAP = 2
+    
+    # Confusion matrix canvas geometry, fixed by the sizes above
+    CM_CELLS = _cm_cell_boxes(CM_CELL_WIDTH, CM_CELL_HEIGHT, CM_GAP)
+    CM_CANVAS_SIZE = (3 * CM_CELL_WIDTH + 4 * CM_GAP, 3 * CM_CELL_HEIGHT + 4 * CM_GAP)
+    
+    # Performance metrics canvas layout (px): label column width and the
+    # height of one label/value + bar row
+    METRIC_LABEL_WIDTH = 120
+    METRIC_ROW_HEIGHT = 52
+    
     def __init__(self, parent, controller, **kwargs):
         super().__init__(parent, controller, **kwargs)
         self.selected_algorithm = 'xgboost'  # Default selection (best model)
         self.algo_buttons = {}
-        self.setup_page()
+        self._style = ttk.Style(self)
+        
+        # The widget tree is built on first show (see on_show)
+        self._built = False
+    
+    def on_show(self):
+        """Build the page the first time it is shown."""
+        if not self._built:
+            self._built = True
+            self.setup_page()
     
     def setup_page(self):
         """Setup the analytics page."""
-        # Header
-        self.create_header(
-            "Model Analytics",
-            "Compare algorithms and understand why our model was chosen"
+        # Detach the scroll container while the page is built so the whole
+        # tree is laid out in one pass when it is re-packed
+        with suspended_layout(self.scrollable):
+            # Header
+            self.create_header(
+                "Model Analytics",
+                "Compare algorithms and understand why our model was chosen"
+            )
+            
+            # Main content
+            self.main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
+            self.main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
+            
+            # Algorithm selector section
+            self.create_algorithm_selector()
+            
+            # Dynamic content area (will update based on selection)
+            self.dynamic_frame = tk.Frame(self.main_frame, bg=COLORS['bg_medium'])
+            self.dynamic_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
+            self.build_display()
+            
+            # Initial display
+            self.update_display()
+    
+    @staticmethod
+    def create_section_title(parent, text):
+        """Create an accent-colored card title label (left to the caller to place)."""
+        return tk.Label(
+            parent, text=text,
+            font=_font(FONTS['subheading']),
+            bg=COLORS['bg_card'],
+            fg=COLORS['accent']
         )
-        
-        # Main content
-        self.main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
-        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
-        
-        # Algorithm selector section
-        self.create_algorithm_selector()
-        
-        # Dynamic content area (will update based on selection)
-        self.dynamic_frame = tk.Frame(self.main_frame, bg=COLORS['bg_medium'])
-        self.dynamic_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
-        
-        # Initial display
-        self.update_display()
     
     def create_algorithm_selector(self):
         """Create the clickable algorithm selector cards."""
@@ -139,16 +326,11 @@ class ChartsPage(BasePage):
         title_row = tk.Frame(card, bg=COLORS['bg_card'])
         title_row.pack(fill=tk.X, padx=20, pady=(15, 10))
         
-        tk.Label(
-            title_row, text="🤖  Select Algorithm to Analyze",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(side=tk.LEFT)
+        self.create_section_title(title_row, "🤖  Select Algorithm to Analyze").pack(side=tk.LEFT)
         
         tk.Label(
             title_row, text="Click on an algorithm to see its detailed metrics",
-            font=FONTS['small'],
+            font=_font(FONTS['small']),
             bg=COLORS['bg_card'],
             fg=COLORS['text_muted']
         ).pack(side=tk.RIGHT)
@@ -157,53 +339,78 @@ class ChartsPage(BasePage):
         algo_frame = tk.Frame(card, bg=COLORS['bg_card'])
         algo_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        for algo_key, algo_data in self.ALGORITHMS.items():
-            self.create_algo_button(algo_frame, algo_key, algo_data)
+        # One equal-width grid column per card
+        for column, (algo_key, algo_data) in enumerate(self.ALGORITHMS.items()):
+            algo_frame.columnconfigure(column, weight=1, uniform='algo')
+            self.create_algo_button(algo_frame, algo_key, algo_data, column)
     
-    def create_algo_button(self, parent, algo_key, algo_data):
+    def create_algo_button(self, parent, algo_key, algo_data, column):
         """Create a clickable algorithm card."""
+        # Local bindings for the theme values used below
+        accent = COLORS['accent']
+        text_primary = COLORS['text_primary']
+        bg_light = COLORS['bg_light']
+        text_secondary = COLORS['text_secondary']
+        success = COLORS['success']
+        warning = COLORS['warning']
+        text_muted = COLORS['text_muted']
+        font_body_bold = _font(FONTS['body_bold'])
+        font_small = _font(FONTS['small'])
+        
         is_selected = algo_key == self.selected_algorithm
-        is_best = algo_data['is_best']
+        is_best = algo_data.is_best
         
         # Determine colors
         if is_selected:
-            bg_color = COLORS['accent']
-            fg_color = COLORS['text_primary']
+            bg_color = accent
+            fg_color = text_primary
         else:
-            bg_color = COLORS['bg_light']
-            fg_color = COLORS['text_secondary']
+            bg_color = bg_light
+            fg_color = text_secondary
+        
+        # Per-card styles: "<key>.Algo.TFrame"/"<key>.Algo.TLabel" carry the
+        # card background, and the name/metric label styles inherit it, so
+        # hover recolors the whole card with two style updates
+        frame_style = f"{algo_key}.Algo.TFrame"
+        label_style = f"{algo_key}.Algo.TLabel"
+        name_style = f"Name.{label_style}"
+        acc_style = f"Metric.{label_style}"
+        
+        style = self._style
+        style.configure(frame_style, background=bg_color)
+        style.configure(label_style, background=bg_color)
+        style.configure(name_style, foreground=fg_color)
+        style.configure(acc_style, foreground=fg_color if is_selected else text_muted)
         
         # Card frame
-        card = tk.Frame(parent, bg=bg_color, cursor='hand2', padx=20, pady=12)
-        card.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5)
+        card = ttk.Frame(parent, style=frame_style, cursor='hand2', padding=(20, 12))
+        card.grid(row=0, column=column, sticky=tk.NSEW, padx=5)
         
         # Best badge
         if is_best:
             badge = tk.Label(
                 card, text="⭐ BEST",
-                font=('Segoe UI', 8, 'bold'),
-                bg=COLORS['success'] if not is_selected else COLORS['warning'],
-                fg=COLORS['text_primary'],
+                font=_font(('Segoe UI', 8, 'bold')),
+                bg=success if not is_selected else warning,
+                fg=text_primary,
                 padx=5, pady=1
             )
             badge.pack(anchor=tk.E)
         
         # Algorithm name
-        name_label = tk.Label(
-            card, text=algo_data['name'],
-            font=FONTS['body_bold'],
-            bg=bg_color,
-            fg=fg_color,
+        name_label = ttk.Label(
+            card, text=algo_data.name,
+            font=font_body_bold,
+            style=name_style,
             cursor='hand2'
         )
         name_label.pack(anchor=tk.W)
         
         # ROC-AUC (selection metric)
-        acc_label = tk.Label(
-            card, text=f"ROC-AUC: {algo_data.get('roc_auc', 0):.1f}%",
-            font=FONTS['small'],
-            bg=bg_color,
-            fg=fg_color if is_selected else COLORS['text_muted'],
+        acc_label = ttk.Label(
+            card, text=algo_data.selector_metric,
+            font=font_small,
+            style=acc_style,
             cursor='hand2'
         )
         acc_label.pack(anchor=tk.W)
@@ -213,29 +420,33 @@ class ChartsPage(BasePage):
             'card': card,
             'name': name_label,
             'acc': acc_label,
-            'badge': badge if is_best else None
+            'badge': badge if is_best else None,
+            'styles': (frame_style, label_style, name_style, acc_style)
         }
         
-        # Bind click events
-        def on_click(e, key=algo_key):
-            self.select_algorithm(key)
-        
-        def on_enter(e, c=card, n=name_label, a=acc_label, key=algo_key):
-            if key != self.selected_algorithm:
-                c.config(bg=COLORS['sidebar_hover'])
-                n.config(bg=COLORS['sidebar_hover'])
-                a.config(bg=COLORS['sidebar_hover'])
-        
-        def on_leave(e, c=card, n=name_label, a=acc_label, key=algo_key):
-            if key != self.selected_algorithm:
-                c.config(bg=COLORS['bg_light'])
-                n.config(bg=COLORS['bg_light'])
-                a.config(bg=COLORS['bg_light'])
-        
-        for widget in [card, name_label, acc_label]:
-            widget.bind('<Button-1>', on_click)
-            widget.bind('<Enter>', on_enter)
-            widget.bind('<Leave>', on_leave)
+        # Bind click/hover events to shared handlers; each widget carries its key
+        for widget in (card, name_label, acc_label):
+            widget._algo_key = algo_key
+            widget.bind('<Button-1>', self._on_algo_click)
+            widget.bind('<Enter>', self._on_algo_enter)
+            widget.bind('<Leave>', self._on_algo_leave)
+    
+    def _on_algo_click(self, event):
+        self.select_algorithm(event.widget._algo_key)
+    
+    def _on_algo_enter(self, event):
+        self._set_algo_hover(event.widget._algo_key, COLORS['sidebar_hover'])
+    
+    def _on_algo_leave(self, event):
+        self._set_algo_hover(event.widget._algo_key, COLORS['bg_light'])
+    
+    def _set_algo_hover(self, algo_key, bg_color):
+        """Recolor an unselected algorithm card for hover feedback."""
+        if algo_key == self.selected_algorithm:
+            return
+        frame_style, label_style = self.algo_buttons[algo_key]['styles'][:2]
+        self._style.configure(frame_style, background=bg_color)
+        self._style.configure(label_style, background=bg_color)
     
     def select_algorithm(self, algo_key):
         """Select an algorithm and update the display."""
@@ -244,201 +455,255 @@ class ChartsPage(BasePage):
         
         self.selected_algorithm = algo_key
         
+        # Local bindings for the theme values used in the loop
+        accent = COLORS['accent']
+        bg_light = COLORS['bg_light']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        text_muted = COLORS['text_muted']
+        success = COLORS['success']
+        warning = COLORS['warning']
+        configure = self._style.configure
+        
         # Update button styles
         for key, widgets in self.algo_buttons.items():
             is_selected = key == algo_key
-            bg_color = COLORS['accent'] if is_selected else COLORS['bg_light']
-            fg_color = COLORS['text_primary'] if is_selected else COLORS['text_secondary']
+            bg_color = accent if is_selected else bg_light
+            fg_color = text_primary if is_selected else text_secondary
             
-            widgets['card'].config(bg=bg_color)
-            widgets['name'].config(bg=bg_color, fg=fg_color)
-            widgets['acc'].config(bg=bg_color, fg=fg_color if is_selected else COLORS['text_muted'])
+            frame_style, label_style, name_style, acc_style = widgets['styles']
+            configure(frame_style, background=bg_color)
+            configure(label_style, background=bg_color)
+            configure(name_style, foreground=fg_color)
+            configure(acc_style, foreground=fg_color if is_selected else text_muted)
             
             if widgets['badge']:
                 widgets['badge'].config(
-                    bg=COLORS['success'] if not is_selected else COLORS['warning']
+                    bg=success if not is_selected else warning
                 )
         
         # Update content
         self.update_display()
     
-    def update_display(self):
-        """Update the dynamic content based on selected algorithm."""
-        # Clear previous content
-        for widget in self.dynamic_frame.winfo_children():
-            widget.destroy()
-        
-        algo = self.ALGORITHMS[self.selected_algorithm]
-        
+    def build_display(self):
+        """Build the shared column layout and the comparison table."""
         # Two columns layout
         columns_frame = tk.Frame(self.dynamic_frame, bg=COLORS['bg_medium'])
         columns_frame.pack(fill=tk.BOTH, expand=True)
         
         # Left column
-        left_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
-        left_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        self.create_performance_section(left_col, algo)
-        self.create_confusion_matrix(left_col, algo)
+        self._left_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
+        self._left_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         # Right column
-        right_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
-        right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
+        self._right_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
+        self._right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
+        
+        # Per-algorithm sections are built on first selection and cached
+        self._algo_views = {}
+        self._shown_view = None
+        
+        self._comparison_card = self.create_comparison_summary(self._right_col)
+    
+    def update_display(self):
+        """Update the dynamic content based on selected algorithm."""
+        key = self.selected_algorithm
+        
+        # A new view is built into unpacked frames, so it is laid out
+        # detached; showing a view is then a plain pack swap
+        view = self._algo_views.get(key)
+        if view is None:
+            view = self._algo_views[key] = self._build_algo_view(self.ALGORITHMS[key])
+        
+        if self._shown_view is not None:
+            for frame in self._shown_view:
+                frame.pack_forget()
         
-        self.create_algorithm_info(right_col, algo)
-        self.create_comparison_summary(right_col)
+        left, right = view
+        left.pack(fill=tk.BOTH, expand=True)
+        right.pack(fill=tk.X, before=self._comparison_card)
+        self._shown_view = view
+        
+        self.apply_comparison_summary()
+    
+    def _build_algo_view(self, algo):
+        """Build the (left, right) column sections for one algorithm."""
+        left = tk.Frame(self._left_col, bg=COLORS['bg_medium'])
+        self.create_performance_section(left, algo)
+        self.create_confusion_matrix(left, algo)
+        
+        right = tk.Frame(self._right_col, bg=COLORS['bg_medium'])
+        self.create_algorithm_info(right, algo)
+        
+        return left, right
     
     def create_performance_section(self, parent, algo):
         """Create performance metrics section for selected algorithm."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        success = COLORS['success']
+        text_primary = COLORS['text_primary']
+        bg_light = COLORS['bg_light']
+        font_small = _font(FONTS['small'])
+        font_body_bold = _font(FONTS['body_bold'])
+        font_heading = _font(FONTS['heading'])
+        
+        card = tk.Frame(parent, bg=bg_card)
         card.pack(fill=tk.X, pady=(0, 15))
         
         # Title with algorithm name
-        title_frame = tk.Frame(card, bg=COLORS['bg_card'])
+        title_frame = tk.Frame(card, bg=bg_card)
         title_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
         
-        tk.Label(
-            title_frame, text=f"📈  {algo['name']} Performance",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(side=tk.LEFT)
+        self.create_section_title(title_frame, algo.perf_title).pack(side=tk.LEFT)
         
-        if algo['is_best']:
+        if algo.is_best:
             tk.Label(
                 title_frame, text="⭐ Selected Model",
-                font=FONTS['small'],
-                bg=COLORS['success'],
-                fg=COLORS['text_primary'],
+                font=font_small,
+                bg=success,
+                fg=text_primary,
                 padx=8, pady=2
             ).pack(side=tk.RIGHT)
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
+        content = tk.Frame(card, bg=bg_card)
         content.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        # Metrics with visual bars
-        metrics = [
-            ("Accuracy", algo['accuracy'], COLORS['success'] if algo['accuracy'] >= 70 else COLORS['warning']),
-            ("Precision", algo['precision'], COLORS['success'] if algo['precision'] >= 60 else COLORS['warning']),
-            ("Recall", algo['recall'], COLORS['success'] if algo['recall'] >= 85 else (COLORS['warning'] if algo['recall'] >= 35 else COLORS['danger'])),
-            ("F1-Score", algo['f1_score'], COLORS['accent']),
-            ("ROC-AUC", algo.get('roc_auc', 0), COLORS['success'] if algo.get('roc_auc', 0) >= 83 else COLORS['warning']),
-        ]
-        
-        for metric, value, color in metrics:
-            frame = tk.Frame(content, bg=COLORS['bg_card'])
-            frame.pack(fill=tk.X, pady=5)
-            
-            # Label and value
-            label_frame = tk.Frame(frame, bg=COLORS['bg_card'])
-            label_frame.pack(fill=tk.X)
-            
-            tk.Label(
-                label_frame, text=metric, width=12, anchor=tk.W,
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_primary']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                label_frame, text=f"{value:.1f}%",
-                font=FONTS['heading'],
-                bg=COLORS['bg_card'],
-                fg=color
-            ).pack(side=tk.LEFT, padx=10)
-            
-            # Progress bar
-            bar_frame = tk.Frame(frame, bg=COLORS['bg_light'], height=10)
-            bar_frame.pack(fill=tk.X, pady=(3, 0))
-            bar_frame.pack_propagate(False)
+        # Metrics with visual bars, drawn on one canvas: a label/value line
+        # followed by a full-width bar per metric
+        row_h = self.METRIC_ROW_HEIGHT
+        value_x = self.METRIC_LABEL_WIDTH + 10
+        metrics = algo.colored_metrics
+        canvas = tk.Canvas(
+            content, height=len(metrics) * row_h,
+            bg=bg_card, highlightthickness=0
+        )
+        canvas.pack(fill=tk.X)
+        
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        bars = []
+        for i, (metric, value, value_text, color_key) in enumerate(metrics):
+            # Resolved here so a theme change applies to pages built later
+            color = COLORS[color_key]
+            y = i * row_h
+            create_text(0, y + 20, text=metric, anchor=tk.W, font=font_body_bold, fill=text_primary)
+            create_text(value_x, y + 20, text=value_text, anchor=tk.W, font=font_heading, fill=color)
             
-            bar = tk.Frame(bar_frame, bg=color, height=10)
-            bar.place(relwidth=value/100, relheight=1)
+            # Bar track and fill, stretched to the canvas width on resize
+            track_id = create_rectangle(0, y + 38, 0, y + 48, fill=bg_light, outline='')
+            fill_id = create_rectangle(0, y + 38, 0, y + 48, fill=color, outline='')
+            bars.append((track_id, fill_id, y + 38, value))
+        
+        canvas._resize_pending = None
+        canvas._resize_width = 0
+        canvas.bind('<Configure>', lambda e: self._on_metrics_configure(canvas, bars, e.width))
+    
+    def _on_metrics_configure(self, canvas, bars, width):
+        """Throttle resize events to at most one bar update per ~16 ms frame.
+        
+        The latest width is kept and applied when the pending timer fires,
+        so the bars follow a drag instead of waiting for it to stop.
+        """
+        canvas._resize_width = width
+        if canvas._resize_pending is None:
+            canvas._resize_pending = canvas.after(16, self._stretch_metric_bars, canvas, bars)
+    
+    @staticmethod
+    def _stretch_metric_bars(canvas, bars):
+        """Resize every metric bar to the latest canvas width in one pass."""
+        canvas._resize_pending = None
+        width = canvas._resize_width
+        coords = canvas.coords
+        for track_id, fill_id, y, value in bars:
+            coords(track_id, 0, y, width, y + 10)
+            coords(fill_id, 0, y, width * value / 100, y + 10)
     
     def create_confusion_matrix(self, parent, algo):
         """Create confusion matrix for selected algorithm."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        bg_light = COLORS['bg_light']
+        text_secondary = COLORS['text_secondary']
+        text_primary = COLORS['text_primary']
+        text_muted = COLORS['text_muted']
+        success = COLORS['success']
+        danger = COLORS['danger']
+        font_small = _font(FONTS['small'])
+        font_body_bold = _font(FONTS['body_bold'])
+        
+        card = tk.Frame(parent, bg=bg_card)
         card.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(
-            card, text="📊  Confusion Matrix",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        self.create_section_title(card, "📊  Confusion Matrix").pack(anchor=tk.W, padx=20, pady=(15, 10))
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
+        content = tk.Frame(card, bg=bg_card)
         content.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        cm = algo['confusion_matrix']
-        tn, fp = cm[0]
-        fn, tp = cm[1]
-        
-        matrix_data = [
-            ["", "Predicted\nStay", "Predicted\nChurn"],
-            ["Actual Stay", f"{tn} ✓", str(fp)],
-            ["Actual Churn", str(fn), f"{tp} ✓"],
-        ]
-        
-        matrix_frame = tk.Frame(content, bg=COLORS['bg_light'])
-        matrix_frame.pack(fill=tk.X)
-        
-        for i, row_data in enumerate(matrix_data):
-            row = tk.Frame(matrix_frame, bg=COLORS['bg_light'])
-            row.pack(fill=tk.X)
-            for j, cell in enumerate(row_data):
-                is_header = i == 0 or j == 0
-                is_correct = "✓" in cell
-                
-                if is_correct:
-                    bg_color = COLORS['success']
-                    fg_color = COLORS['text_primary']
-                elif is_header:
-                    bg_color = COLORS['bg_light']
-                    fg_color = COLORS['text_secondary']
-                else:
-                    bg_color = COLORS['danger']
-                    fg_color = COLORS['text_primary']
-                
-                tk.Label(
-                    row, text=cell.replace(" ✓", ""),
-                    font=FONTS['small'] if is_header else FONTS['body_bold'],
-                    bg=bg_color, fg=fg_color,
-                    width=12, height=2,
-                    relief=tk.FLAT
-                ).pack(side=tk.LEFT, padx=1, pady=1)
+        # 3x3 grid drawn on one canvas instead of a grid of labels
+        width, height = self.CM_CANVAS_SIZE
+        canvas = tk.Canvas(
+            content,
+            width=width, height=height,
+            bg=bg_light, highlightthickness=0
+        )
+        canvas.pack(fill=tk.X)
+        
+        # Pick every cell's colors and text first (geometry is precomputed
+        # in CM_CELLS), then emit all rectangles followed by all texts
+        # through local bindings of the canvas methods
+        cells = dict(algo.cm_strings)
+        layout = []
+        for i, j, rect, center in self.CM_CELLS:
+            if i == 0 or j == 0:
+                layout.append((rect, center, bg_light, text_secondary, _CM_HEADERS[(i, j)], font_small))
+            else:
+                # Diagonal cells are correct predictions
+                layout.append((rect, center, success if i == j else danger, text_primary,
+                               cells[(i, j)], font_body_bold))
+        
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        for rect, _, bg_color, _, _, _ in layout:
+            create_rectangle(*rect, fill=bg_color, outline='')
+        for _, center, _, fg_color, text, font in layout:
+            create_text(*center, text=text, font=font, fill=fg_color, justify=tk.CENTER)
         
         # Interpretation
-        total = tn + fp + fn + tp
-        correct = tn + tp
         tk.Label(
-            content, text=f"\nCorrect predictions: {correct}/{total} ({correct/total*100:.1f}%)",
-            font=FONTS['small'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_muted']
+            content, text=algo.correct_summary,
+            font=font_small,
+            bg=bg_card,
+            fg=text_muted
         ).pack(anchor=tk.W, pady=(10, 0))
     
     def create_algorithm_info(self, parent, algo):
         """Create algorithm information and reasoning section."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        text_secondary = COLORS['text_secondary']
+        success = COLORS['success']
+        warning = COLORS['warning']
+        danger = COLORS['danger']
+        bg_light = COLORS['bg_light']
+        font_body = _font(FONTS['body'])
+        font_body_bold = _font(FONTS['body_bold'])
+        font_small = _font(FONTS['small'])
+        
+        card = tk.Frame(parent, bg=bg_card)
         card.pack(fill=tk.X, pady=(0, 15))
         
-        tk.Label(
-            card, text="📖  About This Algorithm",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        self.create_section_title(card, "📖  About This Algorithm").pack(anchor=tk.W, padx=20, pady=(15, 10))
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
+        content = tk.Frame(card, bg=bg_card)
         content.pack(fill=tk.X, padx=20, pady=(0, 15))
         
         # Description
         tk.Label(
-            content, text=algo['description'],
-            font=FONTS['body'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary'],
+            content, text=algo.description,
+            font=font_body,
+            bg=bg_card,
+            fg=text_secondary,
             wraplength=350,
             justify=tk.LEFT
         ).pack(anchor=tk.W, pady=(0, 10))
@@ -446,174 +711,137 @@ class ChartsPage(BasePage):
         # Strengths
         tk.Label(
             content, text="✅ Strengths:",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['success']
+            font=font_body_bold,
+            bg=bg_card,
+            fg=success
         ).pack(anchor=tk.W, pady=(5, 0))
         
-        for strength in algo['strengths']:
-            tk.Label(
-                content, text=f"  • {strength}",
-                font=FONTS['small'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_secondary']
-            ).pack(anchor=tk.W)
+        tk.Label(
+            content, text=algo.strengths_text,
+            font=font_small,
+            bg=bg_card,
+            fg=text_secondary,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W)
         
         # Weaknesses
         tk.Label(
             content, text="⚠️ Weaknesses:",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['warning']
+            font=font_body_bold,
+            bg=bg_card,
+            fg=warning
         ).pack(anchor=tk.W, pady=(10, 0))
         
-        for weakness in algo['weaknesses']:
-            tk.Label(
-                content, text=f"  • {weakness}",
-                font=FONTS['small'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_secondary']
-            ).pack(anchor=tk.W)
+        tk.Label(
+            content, text=algo.weaknesses_text,
+            font=font_small,
+            bg=bg_card,
+            fg=text_secondary,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W)
         
         # Why chosen / not chosen
-        why_frame = tk.Frame(content, bg=COLORS['bg_light'], padx=10, pady=10)
+        why_frame = tk.Frame(content, bg=bg_light, padx=10, pady=10)
         why_frame.pack(fill=tk.X, pady=(15, 0))
         
-        if algo['is_best']:
-            tk.Label(
-                why_frame, text="🏆 Why This Model Was Chosen:",
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['success']
-            ).pack(anchor=tk.W)
-            
-            tk.Label(
-                why_frame, text=algo['why_chosen'],
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_secondary'],
-                wraplength=330,
-                justify=tk.LEFT
-            ).pack(anchor=tk.W, pady=(5, 0))
+        if algo.is_best:
+            why_title, why_color, why_text = "🏆 Why This Model Was Chosen:", success, algo.why_chosen
         else:
-            tk.Label(
-                why_frame, text="❌ Why This Model Was Not Selected:",
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['danger']
-            ).pack(anchor=tk.W)
-            
-            tk.Label(
-                why_frame, text=algo['why_not'],
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_secondary'],
-                wraplength=330,
-                justify=tk.LEFT
-            ).pack(anchor=tk.W, pady=(5, 0))
+            why_title, why_color, why_text = "❌ Why This Model Was Not Selected:", danger, algo.why_not
+        
+        tk.Label(
+            why_frame, text=why_title,
+            font=font_body_bold,
+            bg=bg_light,
+            fg=why_color
+        ).pack(anchor=tk.W)
+        
+        tk.Label(
+            why_frame, text=why_text,
+            font=font_small,
+            bg=bg_light,
+            fg=text_secondary,
+            wraplength=330,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W, pady=(5, 0))
     
     def create_comparison_summary(self, parent):
         """Create quick comparison summary table with ROI and p-value columns."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        accent = COLORS['accent']
+        bg_light = COLORS['bg_light']
+        text_muted = COLORS['text_muted']
+        text_secondary = COLORS['text_secondary']
+        text_primary = COLORS['text_primary']
+        font_small = _font(FONTS['small'])
+        font_body = _font(FONTS['body'])
+        font_body_bold = _font(FONTS['body_bold'])
+        
+        card = tk.Frame(parent, bg=bg_card)
         card.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(
-            card, text="⚖️  All Models Comparison",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        self.create_section_title(card, "⚖️  All Models Comparison").pack(anchor=tk.W, padx=20, pady=(15, 10))
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
+        content = tk.Frame(card, bg=bg_card)
         content.pack(fill=tk.X, padx=20, pady=(0, 15))
         
-        # Header
-        header = tk.Frame(content, bg=COLORS['bg_light'])
-        header.pack(fill=tk.X, pady=(0, 5), padx=(8, 0))
+        # Table: one native Treeview, rows keyed by algorithm; the selected
+        # algorithm is highlighted through the tree selection, which only
+        # the algorithm selector changes
+        style = self._style
+        style.configure(
+            'Comparison.Treeview',
+            background=bg_card, fieldbackground=bg_card,
+            foreground=text_secondary, font=font_body,
+            rowheight=26, borderwidth=0
+        )
+        style.configure(
+            'Comparison.Treeview.Heading',
+            background=bg_light, foreground=text_muted,
+            font=font_small, relief=tk.FLAT
+        )
+        style.map(
+            'Comparison.Treeview',
+            background=[('selected', accent)],
+            foreground=[('selected', text_primary)]
+        )
         
-        for h, w in [("Model", 18), ("ROC-AUC", 8), ("Recall", 7), ("F1", 6), ("ROI $", 9), ("p-val", 8)]:
-            tk.Label(
-                header, text=h, width=w,
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_muted']
-            ).pack(side=tk.LEFT, padx=1, pady=5)
+        tree = ttk.Treeview(
+            content, columns=_COMPARISON_COLUMNS, show='tree headings',
+            height=len(self.ALGORITHMS), selectmode='none',
+            style='Comparison.Treeview'
+        )
+        for i, (col, heading, width) in enumerate(_COMPARISON_HEADERS):
+            col_id = '#0' if i == 0 else col
+            tree.heading(col_id, text=heading, anchor=tk.W if i == 0 else tk.CENTER)
+            tree.column(col_id, width=width, minwidth=width, stretch=i == 0,
+                        anchor=tk.W if i == 0 else tk.CENTER)
+        tree.tag_configure('best', font=font_body_bold)
+        tree.pack(fill=tk.X)
         
-        # Data rows
         for key, data in self.ALGORITHMS.items():
-            is_selected = key == self.selected_algorithm
-            row_bg = COLORS['accent'] if is_selected else COLORS['bg_card']
-            row_fg = COLORS['text_primary'] if is_selected else COLORS['text_secondary']
-            
-            row = tk.Frame(content, bg=row_bg)
-            row.pack(fill=tk.X, pady=1)
-            
-            # Name with star for best
-            name_text = f"⭐ {data['name']}" if data['is_best'] else f"   {data['name']}"
-            tk.Label(
-                row, text=name_text, width=18, anchor=tk.W,
-                font=FONTS['body_bold'] if data['is_best'] or is_selected else FONTS['body'],
-                bg=row_bg,
-                fg=row_fg
-            ).pack(side=tk.LEFT, padx=1, pady=3)
-            
-            # AUC
-            auc_val = data.get('roc_auc', 0)
-            auc_color = COLORS['success'] if auc_val >= 83 else COLORS['warning']
-            if is_selected: auc_color = COLORS['text_primary']
-            tk.Label(
-                row, text=f"{auc_val:.1f}%", width=8,
-                font=FONTS['body'], bg=row_bg, fg=auc_color
-            ).pack(side=tk.LEFT, padx=1)
-            
-            # Recall
-            rec_val = data['recall']
-            rec_color = COLORS['success'] if rec_val >= 80 else COLORS['warning']
-            if is_selected: rec_color = COLORS['text_primary']
-            tk.Label(
-                row, text=f"{rec_val:.1f}%", width=7,
-                font=FONTS['body'], bg=row_bg, fg=rec_color
-            ).pack(side=tk.LEFT, padx=1)
-            
-            # F1
-            f1_val = data['f1_score']
-            f1_color = COLORS['accent'] if not is_selected else COLORS['text_primary']
-            tk.Label(
-                row, text=f"{f1_val:.1f}%", width=6,
-                font=FONTS['body'], bg=row_bg, fg=f1_color
-            ).pack(side=tk.LEFT, padx=1)
-            
-            # ROI
-            roi_val = data.get('roi', 0)
-            roi_text = f"${roi_val:,}"
-            roi_color = COLORS['success'] if roi_val >= 120000 else COLORS['warning']
-            if is_selected: roi_color = COLORS['text_primary']
-            tk.Label(
-                row, text=roi_text, width=9,
-                font=FONTS['body'], bg=row_bg, fg=roi_color
-            ).pack(side=tk.LEFT, padx=1)
-            
-            # p-value (Wilcoxon)
-            p_val = data.get('wilcoxon_p')
-            if p_val is None:
-                p_text = "Baseline ⭐"
-                p_color = COLORS['accent']
-            elif p_val < 0.05:
-                p_text = f"{p_val:.3f} ✓"
-                p_color = COLORS['success']
-            else:
-                p_text = f"{p_val:.3f}"
-                p_color = COLORS['warning']
-            if is_selected: p_color = COLORS['text_primary']
-            tk.Label(
-                row, text=p_text, width=8,
-                font=FONTS['body'], bg=row_bg, fg=p_color
-            ).pack(side=tk.LEFT, padx=1)
+            tree.insert(
+                '', tk.END, iid=key, text=data.comparison_name,
+                values=data.comparison_values,
+                tags=('best',) if data.is_best else ()
+            )
+        
+        self._comparison_tree = tree
         
         # Legend
         tk.Label(
-            content, text="\n⭐ = Best model | ROI = (TP×$450)−(FP×$50) | p-val = Wilcoxon vs best",
-            font=FONTS['small'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_muted']
+            content, text="\n⭐ = Best model | ✓ = AUC ≥ 83%, Recall ≥ 80%, ROI ≥ $120k, p < 0.05\n"
+                          "ROI = (TP×$450)−(FP×$50) | p-val = Wilcoxon vs best",
+            justify=tk.LEFT,
+            font=font_small,
+            bg=bg_card,
+            fg=text_muted
         ).pack(anchor=tk.W, pady=(10, 0))
+        
+        return card
+    
+    def apply_comparison_summary(self):
+        """Highlight the selected algorithm's row in the comparison table."""
+        if self._comparison_tree.selection() != (self.selected_algorithm,):
+            self._comparison_tree.selection_set(self.selected_algorithm)
@@ -4,129 +4,224 @@ Enhanced overview with stats, charts, and quick insights.
 """
 
 import tkinter as tk
+from tkinter import ttk
 from .base import BasePage
-import sys
-import os
-from datetime import datetime
+import time
+from theme import COLORS, FONTS
+from components.widgets import suspended_layout
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from theme import COLORS, FONTS, ICONS
-from components.widgets import StatCard, Card
+
+# Greeting text, recomputed only when the hour changes
+_GREETING_CACHE = {"hour": -1, "text": ""}
+
+
+def _greeting():
+    """Return the time-of-day greeting for the current local hour."""
+    hour = time.localtime().tm_hour
+    if hour != _GREETING_CACHE["hour"]:
+        _GREETING_CACHE["hour"] = hour
+        _GREETING_CACHE["text"] = "Good Morning" if hour < 12 else "Good Afternoon" if hour < 18 else "Good Evening"
+    return _GREETING_CACHE["text"]
+
+
+def _segment_spans(segments):
+    """Return (start, end) per segment in integer thousandths of the bar width."""
+    spans = []
+    start = 0
+    for width, _, _ in segments:
+        end = start + round(width * 1000)
+        spans.append((start, end))
+        start = end
+    return tuple(spans)
 
 
 class HomePage(BasePage):
     """Enhanced dashboard home page with overview stats and insights."""
     
+    # Bind tag carrying the quick action click handler
+    ACTION_BINDTAG = 'HomeAction'
+    
+    # Stats row cards: (title, value, subtitle, COLORS key)
+    STAT_CARDS = (
+        ("📊 Total Customers", "7,043", "IBM Telco Churn Dataset", 'accent'),
+        ("⚠️ Churn Rate", "26.5%", "1,869 churners identified", 'warning'),
+        ("🎯 Best ROC-AUC", "84.31%", "XGBoost + SMOTE", 'success'),
+        ("🔴 High Risk", "~1,869", "Need immediate attention", 'danger'),
+    )
+    
+    # Quick actions: (title, description, page id, COLORS key, button row)
+    QUICK_ACTIONS = (
+        ("🔮 Predict", "Single prediction", 'predict', 'accent', 0),
+        ("📤 Upload", "Batch process", 'upload', 'success', 0),
+        ("📊 Analytics", "View insights", 'charts', 'warning', 1),
+        ("📄 Reports", "Generate PDF", 'report', 'danger', 1),
+    )
+    
+    # Risk segments of the distribution bar: (fraction, COLORS key, label),
+    # based on ~26.5% churn rate from Telco dataset
+    # High: ~12%, Moderate: ~15%, Low: ~73%
+    RISK_SEGMENTS = (
+        (0.12, 'danger', "High 12%"),
+        (0.15, 'warning', "Med 15%"),
+        (0.73, 'success', "Low 73%"),
+    )
+    RISK_SEGMENT_SPANS = _segment_spans(RISK_SEGMENTS)
+    
+    # Distribution legend: (label, customer count, COLORS key)
+    RISK_LEGEND = (
+        ("🔴 High Risk", "~845 customers", 'danger'),
+        ("🟡 Moderate Risk", "~1,056 customers", 'warning'),
+        ("🟢 Low Risk", "~5,142 customers", 'success'),
+    )
+    
+    # Churn overview key metrics: (label, value)
+    OVERVIEW_METRICS = (
+        ("Avg. Churn Probability", "26.5%"),
+        ("Predicted Churners", "~1,869"),
+        ("Retention Opportunity", "$135,000/mo"),
+    )
+    
+    # Model status rows: (label, value, COLORS key), label text as displayed
+    MODEL_STATUS = (
+        ("Algorithm:", "XGBoost + SMOTE", 'accent'),
+        ("Recall:", "90.64%", 'success'),
+        ("ROC-AUC:", "0.8431", 'success'),
+        ("Dataset:", "IBM Telco (7,043)", 'text_secondary'),
+    )
+    
+    # Key insights: (title, insight, COLORS key), insight text as displayed
+    KEY_INSIGHTS = (
+        ("📋 Contract Type", " — #1 churn predictor — month-to-month is high risk", 'danger'),
+        ("💳 Payment Method", " — Electronic check users churn significantly more", 'warning'),
+        ("🌐 Fiber Optic", " — Fiber optic users churn more than DSL", 'warning'),
+        ("🔒 Add-on Services", " — No security/support = higher churn risk", 'accent'),
+    )
+    
+    # Getting started steps: (number, action, description) as displayed
+    GETTING_STARTED = (
+        ("1️⃣", " Predict", " — Analyze individual customer churn risk"),
+        ("2️⃣", " Upload", " — Batch process CSV files for predictions"),
+        ("3️⃣", " Analytics", " — Explore model performance & insights"),
+        ("4️⃣", " Reports", " — Generate PDF reports to share"),
+    )
+    
     def __init__(self, parent, controller, **kwargs):
         super().__init__(parent, controller, **kwargs)
         self.setup_page()
     
     def setup_page(self):
         """Setup the home page layout."""
-        # Header with greeting
-        current_hour = datetime.now().hour
-        greeting = "Good Morning" if current_hour < 12 else "Good Afternoon" if current_hour < 18 else "Good Evening"
-        
-        self.create_header(
-            f"Dashboard",
-            f"{greeting}! Welcome to the AI Customer Churn Prediction System"
-        )
-        
-        # Main content frame
-        main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
-        
-        # Stats row
-        self.create_stats_section(main_frame)
-        
-        # Two columns layout
-        columns_frame = tk.Frame(main_frame, bg=COLORS['bg_medium'])
-        columns_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
-        
-        # Left column
-        left_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
-        left_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        self.create_quick_actions(left_col)
-        self.create_churn_overview(left_col)
+        self.configure_styles()
+        
+        # Detach the scroll container while the page is built so the whole
+        # tree is laid out in one pass when it is re-packed
+        with suspended_layout(self.scrollable):
+            # Header with greeting
+            self._greeting = _greeting()
+            self.create_header(
+                "Dashboard",
+                self._greeting_text()
+            )
+            self._subtitle_label = self.header_subtitle
+            
+            # Main content frame
+            main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
+            
+            # Stats row
+            self.create_stats_section(main_frame)
+            
+            # Two columns layout
+            columns_frame = tk.Frame(main_frame, bg=COLORS['bg_medium'])
+            columns_frame.pack(fill=tk.BOTH, expand=True, pady=(15, 0))
+            columns_frame.columnconfigure(0, weight=1)
+            columns_frame.columnconfigure(1, weight=1)
+            columns_frame.rowconfigure(0, weight=1)
+            
+            # Left column
+            left_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
+            left_col.grid(row=0, column=0, sticky=tk.NSEW, padx=(0, 10))
+            
+            self.create_quick_actions(left_col)
+            self.create_churn_overview(left_col)
+            
+            # Right column
+            right_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
+            right_col.grid(row=0, column=1, sticky=tk.NSEW, padx=(10, 0))
+            
+            self.create_model_status(right_col)
         
-        # Right column
-        right_col = tk.Frame(columns_frame, bg=COLORS['bg_medium'])
-        right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
+        # The lower right-column sections are built after the first paint
+        self._deferred_built = False
+        self.after_idle(self._build_deferred_sections, right_col)
+    
+    def _build_deferred_sections(self, right_col):
+        """Build the insights and getting started sections once."""
+        if self._deferred_built:
+            return
+        self._deferred_built = True
         
-        self.create_model_status(right_col)
         self.create_key_insights(right_col)
         self.create_getting_started(right_col)
     
+    def configure_styles(self):
+        """Configure the ttk frame and label styles shared by the dashboard cards."""
+        style = ttk.Style(self)
+        style.configure('Card.TFrame', background=COLORS['bg_card'])
+        style.configure('Card.TLabel', background=COLORS['bg_card'])
+        style.configure('Title.Card.TLabel', font=FONTS['subheading'], foreground=COLORS['accent'])
+        style.configure('StatTitle.Card.TLabel', font=FONTS['small'], foreground=COLORS['text_muted'])
+        style.configure('StatSubtitle.Card.TLabel', font=FONTS['tiny'], foreground=COLORS['text_secondary'])
+        for _, _, _, color_key in self.STAT_CARDS:
+            style.configure(
+                f'{color_key}.StatValue.Card.TLabel',
+                font=('Segoe UI', 24, 'bold'), foreground=COLORS[color_key]
+            )
+    
     def create_stats_section(self, parent):
         """Create enhanced stats cards row."""
         stats_frame = tk.Frame(parent, bg=COLORS['bg_medium'])
         stats_frame.pack(fill=tk.X, pady=(0, 0))
         
-        stat_cards_data = [
-            ("📊 Total Customers", "7,043", "IBM Telco Churn Dataset", COLORS['accent']),
-            ("⚠️ Churn Rate", "26.5%", "1,869 churners identified", COLORS['warning']),
-            ("🎯 Best ROC-AUC", "84.31%", "XGBoost + SMOTE", COLORS['success']),
-            ("🔴 High Risk", "~1,869", "Need immediate attention", COLORS['danger']),
-        ]
-        
-        for i, (title, value, subtitle, color) in enumerate(stat_cards_data):
-            self.create_stat_card(stats_frame, title, value, subtitle, color, i)
+        # One equal-width grid column per card
+        for i, (title, value, subtitle, color_key) in enumerate(self.STAT_CARDS):
+            stats_frame.columnconfigure(i, weight=1, uniform='stat')
+            self.create_stat_card(stats_frame, title, value, subtitle, color_key, i)
     
-    def create_stat_card(self, parent, title, value, subtitle, color, index):
+    def create_stat_card(self, parent, title, value, subtitle, color_key, index):
         """Create an enhanced stat card."""
         card = tk.Frame(parent, bg=COLORS['bg_card'])
-        card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0 if index == 0 else 8, 0))
+        card.grid(row=0, column=index, sticky=tk.NSEW, padx=(0 if index == 0 else 8, 0))
         
         content = tk.Frame(card, bg=COLORS['bg_card'], padx=20, pady=15)
         content.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        tk.Label(
-            content, text=title,
-            font=FONTS['small'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_muted']
-        ).pack(anchor=tk.W)
+        ttk.Label(content, text=title, style='StatTitle.Card.TLabel').pack(anchor=tk.W)
         
         # Value with color bar
         value_frame = tk.Frame(content, bg=COLORS['bg_card'])
         value_frame.pack(fill=tk.X, pady=(5, 0))
         
-        tk.Label(
-            value_frame, text=value,
-            font=('Segoe UI', 24, 'bold'),
-            bg=COLORS['bg_card'],
-            fg=color
-        ).pack(side=tk.LEFT)
+        ttk.Label(value_frame, text=value, style=f'{color_key}.StatValue.Card.TLabel').pack(side=tk.LEFT)
         
         # Subtitle
-        tk.Label(
-            content, text=subtitle,
-            font=FONTS['tiny'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_secondary']
-        ).pack(anchor=tk.W, pady=(5, 0))
+        ttk.Label(content, text=subtitle, style='StatSubtitle.Card.TLabel').pack(anchor=tk.W, pady=(5, 0))
         
         # Bottom color accent bar
-        accent_bar = tk.Frame(card, bg=color, height=3)
+        accent_bar = tk.Frame(card, bg=COLORS[color_key], height=3)
         accent_bar.pack(fill=tk.X, side=tk.BOTTOM)
     
     def create_quick_actions(self, parent):
         """Create quick actions section."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        card = ttk.Frame(parent, style='Card.TFrame', padding=(20, 15))
         card.pack(fill=tk.X, pady=(0, 15))
         
         # Title
-        tk.Label(
-            card, text="⚡  Quick Actions",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        ttk.Label(card, text="⚡  Quick Actions", style='Title.Card.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
-        content.pack(fill=tk.X, padx=20, pady=(0, 15))
+        # The card's padding replaces a separate content frame
+        content = card
         
         # Action buttons in a grid
         actions_row1 = tk.Frame(content, bg=COLORS['bg_card'])
@@ -135,291 +230,243 @@ class HomePage(BasePage):
         actions_row2 = tk.Frame(content, bg=COLORS['bg_card'])
         actions_row2.pack(fill=tk.X)
         
-        actions = [
-            ("🔮 Predict", "Single prediction", 'predict', COLORS['accent'], actions_row1),
-            ("📤 Upload", "Batch process", 'upload', COLORS['success'], actions_row1),
-            ("📊 Analytics", "View insights", 'charts', COLORS['warning'], actions_row2),
-            ("📄 Reports", "Generate PDF", 'report', COLORS['danger'], actions_row2),
-        ]
+        # One class-level click binding shared by every action widget
+        self.bind_class(self.ACTION_BINDTAG, '<Button-1>', self._on_action_click)
         
-        for title, desc, page, color, row in actions:
-            self.create_action_button(row, title, desc, page, color)
+        rows = (actions_row1, actions_row2)
+        for title, desc, page, color_key, row in self.QUICK_ACTIONS:
+            self.create_action_button(rows[row], title, desc, page, COLORS[color_key])
     
     def create_action_button(self, parent, title, desc, page, color):
         """Create a quick action button."""
+        # Child widgets inherit the frame's cursor
         frame = tk.Frame(parent, bg=color, cursor='hand2')
         frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 8))
         
         content = tk.Frame(frame, bg=color, padx=15, pady=12)
         content.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(
+        title_label = tk.Label(
             content, text=title,
             font=FONTS['body_bold'],
             bg=color,
-            fg=COLORS['text_primary'],
-            cursor='hand2'
-        ).pack(anchor=tk.W)
+            fg=COLORS['text_primary']
+        )
+        title_label.pack(anchor=tk.W)
         
-        tk.Label(
+        desc_label = tk.Label(
             content, text=desc,
             font=FONTS['tiny'],
             bg=color,
-            fg=COLORS['text_primary'],
-            cursor='hand2'
-        ).pack(anchor=tk.W)
-        
-        def on_click(e, p=page):
-            self.controller.show_page(p)
+            fg=COLORS['text_primary']
+        )
+        desc_label.pack(anchor=tk.W)
         
-        for widget in [frame, content] + list(content.winfo_children()):
-            widget.bind('<Button-1>', on_click)
+        for widget in (frame, content, title_label, desc_label):
+            widget._page = page
+            widget.bindtags((self.ACTION_BINDTAG,) + widget.bindtags())
+    
+    def _on_action_click(self, event):
+        self.controller.show_page(event.widget._page)
     
     def create_churn_overview(self, parent):
         """Create churn distribution overview."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        accent = COLORS['accent']
+        text_primary = COLORS['text_primary']
+        bg_light = COLORS['bg_light']
+        text_muted = COLORS['text_muted']
+        text_secondary = COLORS['text_secondary']
+        font_body_bold = FONTS['body_bold']
+        font_small = FONTS['small']
+        font_tiny = FONTS['tiny']
+        
+        card = ttk.Frame(parent, style='Card.TFrame', padding=(20, 15))
         card.pack(fill=tk.BOTH, expand=True)
         
         # Title
-        tk.Label(
-            card, text="📈  Churn Distribution Overview",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        ttk.Label(card, text="📈  Churn Distribution Overview", style='Title.Card.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
-        content.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
+        # The card's padding replaces a separate content frame
+        content = card
         
         # Visual distribution bar
         tk.Label(
             content, text="Customer Distribution by Risk Level:",
-            font=FONTS['body_bold'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['text_primary']
+            font=font_body_bold,
+            bg=bg_card,
+            fg=text_primary
         ).pack(anchor=tk.W, pady=(0, 10))
         
-        # Distribution bar
-        dist_frame = tk.Frame(content, bg=COLORS['bg_light'], height=40)
-        dist_frame.pack(fill=tk.X)
-        dist_frame.pack_propagate(False)
-        
-        # Risk segments (based on ~26.5% churn rate from Telco dataset)
-        # High: ~12%, Moderate: ~15%, Low: ~73%
-        segments = [
-            (0.12, COLORS['danger'], "High 12%"),
-            (0.15, COLORS['warning'], "Med 15%"),
-            (0.73, COLORS['success'], "Low 73%"),
-        ]
-        
-        x_pos = 0
-        for width, color, label in segments:
-            seg = tk.Frame(dist_frame, bg=color)
-            seg.place(relx=x_pos, relwidth=width, relheight=1)
-            
+        # Distribution bar: one canvas, segments laid out on resize
+        dist_canvas = tk.Canvas(content, height=40, bg=bg_light, highlightthickness=0)
+        dist_canvas.pack(fill=tk.X)
+        
+        # Risk segments, positioned from the precomputed spans
+        segments = []
+        for (width, color_key, label), (start, end) in zip(self.RISK_SEGMENTS, self.RISK_SEGMENT_SPANS):
+            rect_id = dist_canvas.create_rectangle(0, 0, 0, 40, fill=COLORS[color_key], outline='')
+            text_id = None
             if width > 0.1:  # Only show label if segment is wide enough
-                tk.Label(
-                    seg, text=label,
+                text_id = dist_canvas.create_text(
+                    0, 20, text=label,
                     font=('Segoe UI', 8, 'bold'),
-                    bg=color,
-                    fg=COLORS['text_primary']
-                ).pack(expand=True)
-            x_pos += width
+                    fill=text_primary
+                )
+            segments.append((rect_id, text_id, start, end))
+        
+        dist_canvas.bind('<Configure>', lambda e: self._layout_distribution(dist_canvas, segments, e.width))
         
         # Legend
-        legend_frame = tk.Frame(content, bg=COLORS['bg_card'])
+        legend_frame = tk.Frame(content, bg=bg_card)
         legend_frame.pack(fill=tk.X, pady=(15, 0))
         
-        legends = [
-            ("🔴 High Risk", "~845 customers", COLORS['danger']),
-            ("🟡 Moderate Risk", "~1,056 customers", COLORS['warning']),
-            ("🟢 Low Risk", "~5,142 customers", COLORS['success']),
-        ]
-        
-        for label, count, color in legends:
-            leg_item = tk.Frame(legend_frame, bg=COLORS['bg_card'])
+        for label, count, color_key in self.RISK_LEGEND:
+            leg_item = tk.Frame(legend_frame, bg=bg_card)
             leg_item.pack(side=tk.LEFT, expand=True)
             
             tk.Label(
                 leg_item, text=label,
-                font=FONTS['small'],
-                bg=COLORS['bg_card'],
-                fg=color
+                font=font_small,
+                bg=bg_card,
+                fg=COLORS[color_key]
             ).pack()
             
             tk.Label(
                 leg_item, text=count,
-                font=FONTS['tiny'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_muted']
+                font=font_tiny,
+                bg=bg_card,
+                fg=text_muted
             ).pack()
         
         # Key metrics
-        metrics_frame = tk.Frame(content, bg=COLORS['bg_light'], padx=15, pady=10)
+        metrics_frame = tk.Frame(content, bg=bg_light, padx=15, pady=10)
         metrics_frame.pack(fill=tk.X, pady=(15, 0))
         
-        metrics = [
-            ("Avg. Churn Probability", "26.5%"),
-            ("Predicted Churners", "~1,869"),
-            ("Retention Opportunity", "$135,000/mo"),
-        ]
-        
-        for label, value in metrics:
-            row = tk.Frame(metrics_frame, bg=COLORS['bg_light'])
-            row.pack(fill=tk.X, pady=2)
-            
-            tk.Label(
-                row, text=label,
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_secondary']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                row, text=value,
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['accent']
-            ).pack(side=tk.RIGHT)
+        for label, value in self.OVERVIEW_METRICS:
+            self.create_label_row(metrics_frame, bg_light, (
+                (label, font_small, text_secondary, tk.LEFT),
+                (value, font_body_bold, accent, tk.RIGHT),
+            )).pack(fill=tk.X, pady=2)
+    
+    @staticmethod
+    def _layout_distribution(canvas, segments, width):
+        """Position every distribution segment for the canvas width in one pass."""
+        coords = canvas.coords
+        for rect_id, text_id, start, end in segments:
+            x0, x1 = start * width // 1000, end * width // 1000
+            coords(rect_id, x0, 0, x1, 40)
+            if text_id is not None:
+                coords(text_id, (x0 + x1) // 2, 20)
     
     def create_model_status(self, parent):
         """Create model status section."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        success = COLORS['success']
+        text_muted = COLORS['text_muted']
+        font_small = FONTS['small']
+        font_body_bold = FONTS['body_bold']
+        
+        card = ttk.Frame(parent, style='Card.TFrame', padding=(20, 15))
         card.pack(fill=tk.X, pady=(0, 15))
         
         # Title row
-        title_row = tk.Frame(card, bg=COLORS['bg_card'])
-        title_row.pack(fill=tk.X, padx=20, pady=(15, 10))
+        title_row = tk.Frame(card, bg=bg_card)
+        title_row.pack(fill=tk.X, pady=(0, 10))
         
-        tk.Label(
-            title_row, text="🤖  Model Status",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(side=tk.LEFT)
+        ttk.Label(title_row, text="🤖  Model Status", style='Title.Card.TLabel').pack(side=tk.LEFT)
         
         # Status badge
         tk.Label(
             title_row, text="● Active",
             font=('Segoe UI', 9, 'bold'),
-            bg=COLORS['bg_card'],
-            fg=COLORS['success']
+            bg=bg_card,
+            fg=success
         ).pack(side=tk.RIGHT)
         
-        content = tk.Frame(card, bg=COLORS['bg_card'])
-        content.pack(fill=tk.X, padx=20, pady=(0, 15))
+        # The card's padding replaces a separate content frame
+        content = card
         
         # Model info grid
-        info = [
-            ("Algorithm", "XGBoost + SMOTE", COLORS['accent']),
-            ("Recall", "90.64%", COLORS['success']),
-            ("ROC-AUC", "0.8431", COLORS['success']),
-            ("Dataset", "IBM Telco (7,043)", COLORS['text_secondary']),
-        ]
-        
-        for label, value, color in info:
-            row = tk.Frame(content, bg=COLORS['bg_card'])
-            row.pack(fill=tk.X, pady=3)
-            
-            tk.Label(
-                row, text=label + ":",
-                font=FONTS['small'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_muted'],
-                width=12,
-                anchor=tk.W
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                row, text=value,
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_card'],
-                fg=color
-            ).pack(side=tk.LEFT)
+        for label, value, color_key in self.MODEL_STATUS:
+            self.create_label_row(content, bg_card, (
+                (label, font_small, text_muted, tk.LEFT),
+                (value, font_body_bold, COLORS[color_key], tk.LEFT),
+            ), key_width=12).pack(fill=tk.X, pady=3)
     
     def create_key_insights(self, parent):
         """Create key insights section."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_light = COLORS['bg_light']
+        text_secondary = COLORS['text_secondary']
+        font_body_bold = FONTS['body_bold']
+        font_small = FONTS['small']
+        
+        card = ttk.Frame(parent, style='Card.TFrame', padding=(20, 15))
         card.pack(fill=tk.X, pady=(0, 15))
         
-        tk.Label(
-            card, text="💡  Key Insights",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
-        
-        content = tk.Frame(card, bg=COLORS['bg_card'])
-        content.pack(fill=tk.X, padx=20, pady=(0, 15))
-        
-        insights = [
-            ("📋 Contract Type", "#1 churn predictor — month-to-month is high risk", COLORS['danger']),
-            ("💳 Payment Method", "Electronic check users churn significantly more", COLORS['warning']),
-            ("🌐 Fiber Optic", "Fiber optic users churn more than DSL", COLORS['warning']),
-            ("🔒 Add-on Services", "No security/support = higher churn risk", COLORS['accent']),
-        ]
-        
-        for icon_text, insight, color in insights:
-            row = tk.Frame(content, bg=COLORS['bg_light'], padx=10, pady=8)
-            row.pack(fill=tk.X, pady=3)
-            
-            tk.Label(
-                row, text=icon_text,
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_light'],
-                fg=color
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                row, text=f" — {insight}",
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_secondary']
-            ).pack(side=tk.LEFT)
+        ttk.Label(card, text="💡  Key Insights", style='Title.Card.TLabel').pack(anchor=tk.W, pady=(0, 10))
+        
+        # The card's padding replaces a separate content frame
+        content = card
+        
+        for icon_text, insight, color_key in self.KEY_INSIGHTS:
+            self.create_label_row(content, bg_light, (
+                (icon_text, font_body_bold, COLORS[color_key], tk.LEFT),
+                (insight, font_small, text_secondary, tk.LEFT),
+            ), padx=10, pady=8).pack(fill=tk.X, pady=3)
     
     def create_getting_started(self, parent):
         """Create getting started section."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
+        # Local bindings for the theme values used below
+        bg_card = COLORS['bg_card']
+        accent = COLORS['accent']
+        text_primary = COLORS['text_primary']
+        text_secondary = COLORS['text_secondary']
+        font_body_bold = FONTS['body_bold']
+        font_small = FONTS['small']
+        
+        card = ttk.Frame(parent, style='Card.TFrame', padding=(20, 15))
         card.pack(fill=tk.BOTH, expand=True)
         
-        tk.Label(
-            card, text="🚀  Getting Started",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
-        
-        content = tk.Frame(card, bg=COLORS['bg_card'])
-        content.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
-        
-        steps = [
-            ("1️⃣", "Predict", "Analyze individual customer churn risk"),
-            ("2️⃣", "Upload", "Batch process CSV files for predictions"),
-            ("3️⃣", "Analytics", "Explore model performance & insights"),
-            ("4️⃣", "Reports", "Generate PDF reports to share"),
-        ]
-        
-        for num, action, desc in steps:
-            row = tk.Frame(content, bg=COLORS['bg_card'])
-            row.pack(fill=tk.X, pady=4)
-            
-            tk.Label(
-                row, text=num,
-                font=('Segoe UI', 12),
-                bg=COLORS['bg_card'],
-                fg=COLORS['accent']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                row, text=f" {action}",
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_primary']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                row, text=f" — {desc}",
-                font=FONTS['small'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_secondary']
-            ).pack(side=tk.LEFT)
+        ttk.Label(card, text="🚀  Getting Started", style='Title.Card.TLabel').pack(anchor=tk.W, pady=(0, 10))
+        
+        # The card's padding replaces a separate content frame
+        content = card
+        
+        for num, action, desc in self.GETTING_STARTED:
+            self.create_label_row(content, bg_card, (
+                (num, ('Segoe UI', 12), accent, tk.LEFT),
+                (action, font_body_bold, text_primary, tk.LEFT),
+                (desc, font_small, text_secondary, tk.LEFT),
+            )).pack(fill=tk.X, pady=4)
+    
+    @staticmethod
+    def create_label_row(parent, bg, cells, key_width=None, **frame_options):
+        """Create a frame holding one label per (text, font, fg, side) cell.
+        
+        key_width gives the first label a fixed character width so rows line
+        up as a key/value table. The caller places the returned frame.
+        """
+        row = tk.Frame(parent, bg=bg, **frame_options)
+        Label = tk.Label
+        key_options = {'width': key_width, 'anchor': tk.W} if key_width else {}
+        for i, (text, font, fg, side) in enumerate(cells):
+            Label(
+                row, text=text, font=font, bg=bg, fg=fg,
+                **(key_options if i == 0 else {})
+            ).pack(side=side)
+        return row
+    
+    def _greeting_text(self):
+        """Header subtitle for the current greeting."""
+        return f"{self._greeting}! Welcome to the AI Customer Churn Prediction System"
+    
+    def on_show(self):
+        """Refresh the greeting if the time of day changed since it was built."""
+        greeting = _greeting()
+        if greeting != self._greeting:
+            self._greeting = greeting
+            self._subtitle_label.config(text=self._greeting_text())
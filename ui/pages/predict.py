@@ -6,21 +6,129 @@ Customer churn prediction interface.
 import tkinter as tk
 from tkinter import ttk, messagebox
 from .base import BasePage
-import sys
-import os
 import random
+import functools
+import threading
+import collections
+import numpy as np
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from theme import COLORS, FONTS, ICONS
 from components.widgets import AnimatedGauge, FeatureBarChart, ModernButton
-
-# Add src to path
-project_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-sys.path.insert(0, os.path.join(project_dir, 'src'))
-
-from predict import predict_churn, load_model_and_encoders, preprocess_customer_data
-from explain import explain_prediction
-from recommend import generate_full_recommendation
+from predict import (predict_from_features, load_model_and_encoders,
+                     preprocess_into, build_category_maps)
+
+
+# Prediction form layout: one tuple of
+# (label, key, input type, options, default) field specs per row
+_INPUT_ROWS = (
+    # Row 1 - Demographics
+    (("Gender", 'gender', 'combo', ('Male', 'Female'), 'Male'),
+     ("Senior Citizen", 'SeniorCitizen', 'combo', ('No', 'Yes'), 'No'),
+     ("Partner", 'Partner', 'combo', ('Yes', 'No'), 'No'),
+     ("Dependents", 'Dependents', 'combo', ('Yes', 'No'), 'No')),
+    # Row 2 - Account Info
+    (("Tenure (mo)", 'tenure', 'spinbox', (0, 72), 12),
+     ("Contract", 'Contract', 'combo',
+      ('Month-to-month', 'One year', 'Two year'), 'Month-to-month'),
+     ("Monthly ($)", 'MonthlyCharges', 'spinbox', (18.0, 120.0), 50.0),
+     ("Total ($)", 'TotalCharges', 'spinbox', (0.0, 9000.0), 600.0)),
+    # Row 3 - Phone & Internet
+    (("Phone Svc", 'PhoneService', 'combo', ('Yes', 'No'), 'Yes'),
+     ("Multi Lines", 'MultipleLines', 'combo',
+      ('No', 'Yes', 'No phone service'), 'No'),
+     ("Internet Svc", 'InternetService', 'combo',
+      ('DSL', 'Fiber optic', 'No'), 'Fiber optic')),
+    # Row 4 - Add-on Services
+    (("Security", 'OnlineSecurity', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No'),
+     ("Backup", 'OnlineBackup', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No'),
+     ("Device Prot", 'DeviceProtection', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No'),
+     ("Tech Supp", 'TechSupport', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No')),
+    # Row 5 - Streaming & Billing
+    (("Stream TV", 'StreamingTV', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No'),
+     ("Stream Movie", 'StreamingMovies', 'combo',
+      ('Yes', 'No', 'No internet service'), 'No'),
+     ("Paperless", 'PaperlessBilling', 'combo', ('Yes', 'No'), 'Yes'),
+     ("Pay Method", 'PaymentMethod', 'combo',
+      ('Electronic check', 'Mailed check',
+       'Bank transfer (automatic)', 'Credit card (automatic)'),
+      'Electronic check')),
+)
+
+# Form values restored by Clear (also used to warm up the model)
+_DEFAULTS = (
+    ('gender', 'Male'),
+    ('SeniorCitizen', 'No'),
+    ('Partner', 'No'),
+    ('Dependents', 'No'),
+    ('tenure', 12),
+    ('PhoneService', 'Yes'),
+    ('MultipleLines', 'No'),
+    ('InternetService', 'Fiber optic'),
+    ('OnlineSecurity', 'No'),
+    ('OnlineBackup', 'No'),
+    ('DeviceProtection', 'No'),
+    ('TechSupport', 'No'),
+    ('StreamingTV', 'No'),
+    ('StreamingMovies', 'No'),
+    ('Contract', 'Month-to-month'),
+    ('PaperlessBilling', 'Yes'),
+    ('PaymentMethod', 'Electronic check'),
+    ('MonthlyCharges', 50.0),
+    ('TotalCharges', 600.0),
+)
+
+# Fixed part of the high-risk sample (month-to-month, fiber optic, no add-ons)
+_HIGH_RISK = (
+    ('Partner', 'No'),
+    ('Dependents', 'No'),
+    ('PhoneService', 'Yes'),
+    ('InternetService', 'Fiber optic'),
+    ('OnlineSecurity', 'No'),
+    ('OnlineBackup', 'No'),
+    ('DeviceProtection', 'No'),
+    ('TechSupport', 'No'),
+    ('Contract', 'Month-to-month'),
+    ('PaperlessBilling', 'Yes'),
+    ('PaymentMethod', 'Electronic check'),
+)
+
+# Fixed part of the low-risk sample (two-year contract, DSL, with add-ons)
+_LOW_RISK = (
+    ('SeniorCitizen', 'No'),
+    ('Partner', 'Yes'),
+    ('Dependents', 'Yes'),
+    ('PhoneService', 'Yes'),
+    ('MultipleLines', 'Yes'),
+    ('InternetService', 'DSL'),
+    ('OnlineSecurity', 'Yes'),
+    ('OnlineBackup', 'Yes'),
+    ('DeviceProtection', 'Yes'),
+    ('TechSupport', 'Yes'),
+    ('StreamingTV', 'Yes'),
+    ('StreamingMovies', 'Yes'),
+    ('Contract', 'Two year'),
+    ('PaperlessBilling', 'No'),
+)
+
+# Theme color key per risk level (resolved through COLORS at use, so
+# theme switches made by the settings page still apply)
+_RISK_COLOR_KEYS = {'HIGH': 'danger', 'MODERATE': 'warning', 'LOW': 'success'}
+_RISK_ICONS = {'HIGH': '🚨', 'MODERATE': '⚠️', 'LOW': '✅'}
+
+_GENDERS = ('Male', 'Female')
+_YES_NO = ('No', 'Yes')
+_AUTO_PAYMENTS = ('Bank transfer (automatic)', 'Credit card (automatic)')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """Load the model, encoders and feature names once per process."""
+    return load_model_and_encoders()
 
 
 class PredictPage(BasePage):
@@ -30,21 +138,65 @@ class PredictPage(BasePage):
     CLV_BENEFIT = 450   # $ saved per correctly retained churner
     CAMPAIGN_COST = 50  # $ spent per false alarm (unnecessary retention offer)
     
+    # Seconds predict() waits for an unfinished warm-up
+    WARMUP_TIMEOUT = 5.0
+    
+    # Number of recent predictions kept for repeated clicks
+    PRED_CACHE_SIZE = 64
+    
     def __init__(self, parent, controller, **kwargs):
         super().__init__(parent, controller, **kwargs)
         self.model = None
         self.encoders = None
         self.feature_names = None
+        self._warm = threading.Event()
+        self._pred_cache = collections.OrderedDict()
+        self._row = None
+        self._cat_maps = None
+        self._row_lock = threading.Lock()
+        self._predicting = False
+        self._pending_key = None
+        self._show_pending = False
         self.load_model()
+        threading.Thread(target=self._warmup, daemon=True).start()
         self.setup_page()
     
     def load_model(self):
         """Load the trained model."""
         try:
-            self.model, self.encoders, self.feature_names = load_model_and_encoders()
+            self.model, self.encoders, self.feature_names = _get_model()
+            # Reused feature row for every prediction from this page
+            self._row = np.empty((1, len(self.feature_names)))
+            # Category -> code lookups replacing LabelEncoder.transform calls
+            self._cat_maps = build_category_maps(self.encoders)
         except FileNotFoundError:
             pass  # Will show error when predicting
     
+    def _warmup(self):
+        """Run one throwaway prediction so the first real click is fast."""
+        try:
+            if self.model is None:
+                return
+            # Imported here so shap loads off the Tk thread, not at app start
+            from explain import explain_prediction
+            from recommend import generate_full_recommendation
+            
+            customer_data = dict(_DEFAULTS, SeniorCitizen=0)
+            with self._row_lock:
+                features = preprocess_into(self._row, customer_data, self.encoders,
+                                           self.feature_names, self._cat_maps)
+                prediction = predict_from_features(features, self.model)
+                explanation = explain_prediction(features, self.model, self.feature_names, customer_data, self.encoders)
+            generate_full_recommendation(
+                prediction['churn_probability'],
+                customer_data,
+                explanation['top_factors']
+            )
+        except Exception:
+            pass  # Warm-up is best effort; predict() reports real errors
+        finally:
+            self._warm.set()
+    
     def setup_page(self):
         """Setup the prediction page."""
         # Header
@@ -72,22 +224,24 @@ class PredictPage(BasePage):
         self.create_gauge_panel(right_col)
         self.create_chart_panel(right_col)
     
-    def create_input_form(self, parent):
-        """Create the input form for Telco customer features."""
+    def _build_card(self, parent, title, **pack_options):
+        """Create and pack a titled card frame, returning the card."""
         card = tk.Frame(parent, bg=COLORS['bg_card'])
-        card.pack(fill=tk.X, pady=(0, 15))
+        card.pack(**pack_options)
         
         # Title
-        title_frame = tk.Frame(card, bg=COLORS['bg_card'])
-        title_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
-        
         tk.Label(
-            title_frame,
-            text="📋  Customer Information",
+            card,
+            text=title,
             font=FONTS['subheading'],
             bg=COLORS['bg_card'],
             fg=COLORS['accent']
-        ).pack(anchor=tk.W)
+        ).pack(anchor=tk.W, padx=20, pady=(15, 10))
+        return card
+    
+    def create_input_form(self, parent):
+        """Create the input form for Telco customer features."""
+        card = self._build_card(parent, "📋  Customer Information", fill=tk.X, pady=(0, 15))
         
         # Form content - scrollable
         form_frame = tk.Frame(card, bg=COLORS['bg_card'])
@@ -95,83 +249,37 @@ class PredictPage(BasePage):
         
         self.inputs = {}
         
-        # Row 1 - Demographics
-        row1 = tk.Frame(form_frame, bg=COLORS['bg_card'])
-        row1.pack(fill=tk.X, pady=3)
-        
-        self.create_input(row1, "Gender", 'gender', 'combo', ['Male', 'Female'], 'Male')
-        self.create_input(row1, "Senior Citizen", 'SeniorCitizen', 'combo', ['No', 'Yes'], 'No')
-        self.create_input(row1, "Partner", 'Partner', 'combo', ['Yes', 'No'], 'No')
-        self.create_input(row1, "Dependents", 'Dependents', 'combo', ['Yes', 'No'], 'No')
-        
-        # Row 2 - Account Info
-        row2 = tk.Frame(form_frame, bg=COLORS['bg_card'])
-        row2.pack(fill=tk.X, pady=3)
-        
-        self.create_input(row2, "Tenure (mo)", 'tenure', 'spinbox', (0, 72), 12)
-        self.create_input(row2, "Contract", 'Contract', 'combo',
-                         ['Month-to-month', 'One year', 'Two year'], 'Month-to-month')
-        self.create_input(row2, "Monthly ($)", 'MonthlyCharges', 'spinbox', (18.0, 120.0), 50.0)
-        self.create_input(row2, "Total ($)", 'TotalCharges', 'spinbox', (0.0, 9000.0), 600.0)
-        
-        # Row 3 - Phone & Internet
-        row3 = tk.Frame(form_frame, bg=COLORS['bg_card'])
-        row3.pack(fill=tk.X, pady=3)
-        
-        self.create_input(row3, "Phone Svc", 'PhoneService', 'combo', ['Yes', 'No'], 'Yes')
-        self.create_input(row3, "Multi Lines", 'MultipleLines', 'combo',
-                         ['No', 'Yes', 'No phone service'], 'No')
-        self.create_input(row3, "Internet Svc", 'InternetService', 'combo',
-                         ['DSL', 'Fiber optic', 'No'], 'Fiber optic')
-        
-        # Row 4 - Add-on Services
-        row4 = tk.Frame(form_frame, bg=COLORS['bg_card'])
-        row4.pack(fill=tk.X, pady=3)
-        
-        self.create_input(row4, "Security", 'OnlineSecurity', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        self.create_input(row4, "Backup", 'OnlineBackup', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        self.create_input(row4, "Device Prot", 'DeviceProtection', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        self.create_input(row4, "Tech Supp", 'TechSupport', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        
-        # Row 5 - Streaming & Billing
-        row5 = tk.Frame(form_frame, bg=COLORS['bg_card'])
-        row5.pack(fill=tk.X, pady=3)
-        
-        self.create_input(row5, "Stream TV", 'StreamingTV', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        self.create_input(row5, "Stream Movie", 'StreamingMovies', 'combo',
-                         ['Yes', 'No', 'No internet service'], 'No')
-        self.create_input(row5, "Paperless", 'PaperlessBilling', 'combo', ['Yes', 'No'], 'Yes')
-        self.create_input(row5, "Pay Method", 'PaymentMethod', 'combo',
-                         ['Electronic check', 'Mailed check',
-                          'Bank transfer (automatic)', 'Credit card (automatic)'],
-                         'Electronic check')
-    
-    def create_input(self, parent, label, key, input_type, options, default):
-        """Create a single input field."""
-        frame = tk.Frame(parent, bg=COLORS['bg_card'])
-        frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=3)
+        # One grid for every label/field instead of a frame per row and field
+        for r, specs in enumerate(_INPUT_ROWS):
+            for c, spec in enumerate(specs):
+                self.create_input(form_frame, r * 2, c, *spec)
         
+        for c in range(max(len(specs) for specs in _INPUT_ROWS)):
+            form_frame.grid_columnconfigure(c, weight=1, uniform='input')
+    
+    def create_input(self, parent, row, column, label, key, input_type, options, default):
+        """Create a single input field (label above widget) in the form grid."""
         tk.Label(
-            frame, text=label,
+            parent, text=label,
             font=FONTS['small'],
             bg=COLORS['bg_card'],
             fg=COLORS['text_secondary']
-        ).pack(anchor=tk.W)
+        ).grid(row=row, column=column, sticky=tk.W, padx=3, pady=(3, 0))
         
+        # Typed Tk variables, so get_customer_data needs no casts
         if input_type == 'combo':
-            widget = ttk.Combobox(frame, values=options, width=14, state='readonly')
-            widget.set(default)
+            var = tk.StringVar(self, value=default)
+            widget = ttk.Combobox(parent, textvariable=var, values=options, width=14, state='readonly')
         else:
-            widget = ttk.Spinbox(frame, from_=options[0], to=options[1], width=14)
-            widget.set(default)
-        
-        widget.pack(fill=tk.X, pady=(3, 0))
-        self.inputs[key] = widget
+            # Any float bound or default makes the field a float, so IntVar
+            # never truncates it
+            is_float = any(isinstance(v, float) for v in (*options, default))
+            var_type = tk.DoubleVar if is_float else tk.IntVar
+            var = var_type(self, value=default)
+            widget = ttk.Spinbox(parent, textvariable=var, from_=options[0], to=options[1], width=14)
+        
+        widget.grid(row=row + 1, column=column, sticky=tk.EW, padx=3, pady=(3, 3))
+        self.inputs[key] = var
     
     def create_action_buttons(self, parent):
         """Create action buttons."""
@@ -203,20 +311,7 @@ class PredictPage(BasePage):
     
     def create_recommendations_panel(self, parent):
         """Create recommendations button (greyed out until prediction is made)."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
-        card.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
-        
-        # Title
-        title_frame = tk.Frame(card, bg=COLORS['bg_card'])
-        title_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
-        
-        tk.Label(
-            title_frame,
-            text="💡  Recommended Actions",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W)
+        card = self._build_card(parent, "💡  Recommended Actions", fill=tk.BOTH, expand=True, pady=(10, 0))
         
         # Button frame
         btn_frame = tk.Frame(card, bg=COLORS['bg_card'])
@@ -252,20 +347,7 @@ class PredictPage(BasePage):
     
     def create_gauge_panel(self, parent):
         """Create gauge display panel."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
-        card.pack(fill=tk.X, pady=(0, 15))
-        
-        # Title
-        title_frame = tk.Frame(card, bg=COLORS['bg_card'])
-        title_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
-        
-        tk.Label(
-            title_frame,
-            text="📊  Churn Risk Score",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W)
+        card = self._build_card(parent, "📊  Churn Risk Score", fill=tk.X, pady=(0, 15))
         
         # Gauge and info container
         content = tk.Frame(card, bg=COLORS['bg_card'])
@@ -334,20 +416,7 @@ class PredictPage(BasePage):
     
     def create_chart_panel(self, parent):
         """Create chart display panel."""
-        card = tk.Frame(parent, bg=COLORS['bg_card'])
-        card.pack(fill=tk.BOTH, expand=True)
-        
-        # Title
-        title_frame = tk.Frame(card, bg=COLORS['bg_card'])
-        title_frame.pack(fill=tk.X, padx=20, pady=(15, 10))
-        
-        tk.Label(
-            title_frame,
-            text="📈  Feature Impact Analysis",
-            font=FONTS['subheading'],
-            bg=COLORS['bg_card'],
-            fg=COLORS['accent']
-        ).pack(anchor=tk.W)
+        card = self._build_card(parent, "📈  Feature Impact Analysis", fill=tk.BOTH, expand=True)
         
         # Chart
         chart_frame = tk.Frame(card, bg=COLORS['bg_card'])
@@ -366,36 +435,21 @@ class PredictPage(BasePage):
     def get_customer_data(self):
         """Get customer data from inputs."""
         try:
-            # Map SeniorCitizen combo to int
-            senior = 1 if self.inputs['SeniorCitizen'].get() == 'Yes' else 0
-            
-            return {
-                'gender': self.inputs['gender'].get(),
-                'SeniorCitizen': senior,
-                'Partner': self.inputs['Partner'].get(),
-                'Dependents': self.inputs['Dependents'].get(),
-                'tenure': int(self.inputs['tenure'].get()),
-                'PhoneService': self.inputs['PhoneService'].get(),
-                'MultipleLines': self.inputs['MultipleLines'].get(),
-                'InternetService': self.inputs['InternetService'].get(),
-                'OnlineSecurity': self.inputs['OnlineSecurity'].get(),
-                'OnlineBackup': self.inputs['OnlineBackup'].get(),
-                'DeviceProtection': self.inputs['DeviceProtection'].get(),
-                'TechSupport': self.inputs['TechSupport'].get(),
-                'StreamingTV': self.inputs['StreamingTV'].get(),
-                'StreamingMovies': self.inputs['StreamingMovies'].get(),
-                'Contract': self.inputs['Contract'].get(),
-                'PaperlessBilling': self.inputs['PaperlessBilling'].get(),
-                'PaymentMethod': self.inputs['PaymentMethod'].get(),
-                'MonthlyCharges': float(self.inputs['MonthlyCharges'].get()),
-                'TotalCharges': float(self.inputs['TotalCharges'].get())
-            }
-        except ValueError as e:
+            data = {key: var.get() for key, var in self.inputs.items()}
+        except tk.TclError as e:
             messagebox.showerror("Input Error", f"Invalid input: {e}")
             return None
+        
+        # Map SeniorCitizen combo to int
+        data['SeniorCitizen'] = 1 if data['SeniorCitizen'] == 'Yes' else 0
+        return data
     
     def predict(self):
         """Run prediction."""
+        # Ignore clicks while a prediction is still running
+        if self._predicting:
+            return
+        
         if self.model is None:
             messagebox.showerror("Error", "Model not loaded. Please train the model first.")
             return
@@ -404,13 +458,61 @@ class PredictPage(BasePage):
         if not customer_data:
             return
         
+        # Same inputs as a recent prediction - reuse its results
+        key = tuple(sorted(customer_data.items()))
+        cached = self._pred_cache.get(key)
+        if cached is not None:
+            self._pred_cache.move_to_end(key)
+            self.update_results(*cached)
+            return
+        
+        self._predicting = True
+        self.predict_btn.config(state=tk.DISABLED)
+        
+        # A prefetch for these inputs is already running - just show its result
+        if key == self._pending_key:
+            self._show_pending = True
+            return
+        
+        self._start_prediction(customer_data, key, show=True)
+    
+    def _prefetch_predict(self):
+        """Start predicting a freshly loaded sample before Predict is clicked."""
+        if self.model is None or self._predicting:
+            return
+        
+        customer_data = self.get_customer_data()
+        if not customer_data:
+            return
+        
+        key = tuple(sorted(customer_data.items()))
+        if key not in self._pred_cache:
+            self._start_prediction(customer_data, key, show=False)
+    
+    def _start_prediction(self, customer_data, key, show):
+        """Run a prediction on a worker thread; ``show`` draws the result when done."""
+        self._pending_key = key
+        self._show_pending = show
+        threading.Thread(target=self._predict_worker, args=(customer_data, key), daemon=True).start()
+    
+    def _predict_worker(self, customer_data, key):
+        """Compute prediction, explanation and recommendation off the Tk thread."""
+        self._warm.wait(timeout=self.WARMUP_TIMEOUT)
+        
         try:
-            # Predict
-            prediction = predict_churn(customer_data, self.model, self.encoders, self.feature_names)
+            from explain import explain_prediction
+            from recommend import generate_full_recommendation
             
-            # Explain
-            features = preprocess_customer_data(customer_data, self.encoders, self.feature_names)
-            explanation = explain_prediction(features, self.model, self.feature_names, customer_data, self.encoders)
+            with self._row_lock:
+                # Preprocess once for both the model and the explainer
+                features = preprocess_into(self._row, customer_data, self.encoders,
+                                           self.feature_names, self._cat_maps)
+                
+                # Predict
+                prediction = predict_from_features(features, self.model)
+                
+                # Explain
+                explanation = explain_prediction(features, self.model, self.feature_names, customer_data, self.encoders)
             
             # Recommend
             recommendation = generate_full_recommendation(
@@ -418,12 +520,45 @@ class PredictPage(BasePage):
                 customer_data,
                 explanation['top_factors']
             )
-            
-            # Update UI
-            self.update_results(prediction, explanation, recommendation)
-            
         except Exception as e:
-            messagebox.showerror("Error", f"Prediction failed: {str(e)}")
+            self.after(0, self._fail_predict, key, e)
+            return
+        
+        # Hand the results back to the Tk thread
+        self.after(0, self._finish_predict, key, prediction, explanation, recommendation)
+    
+    def _finish_predict(self, key, prediction, explanation, recommendation):
+        """Cache a finished prediction and show it if asked to (runs on the Tk thread)."""
+        self._pred_cache[key] = (prediction, explanation, recommendation)
+        if len(self._pred_cache) > self.PRED_CACHE_SIZE:
+            self._pred_cache.popitem(last=False)
+        
+        # Superseded by a newer prediction - keep it cached only
+        if key != self._pending_key:
+            return
+        self._pending_key = None
+        
+        if self._show_pending:
+            try:
+                self.update_results(prediction, explanation, recommendation)
+            finally:
+                self._end_predict()
+    
+    def _fail_predict(self, key, error):
+        """Report a failed prediction (runs on the Tk thread)."""
+        if key != self._pending_key:
+            return
+        self._pending_key = None
+        
+        # Failed prefetches stay silent; a Predict click reports the error
+        if self._show_pending:
+            self._end_predict()
+            messagebox.showerror("Error", f"Prediction failed: {str(error)}")
+    
+    def _end_predict(self):
+        """Accept Predict clicks again."""
+        self._predicting = False
+        self.predict_btn.config(state=tk.NORMAL)
     
     def update_results(self, prediction, explanation, recommendation):
         """Update result displays."""
@@ -435,10 +570,9 @@ class PredictPage(BasePage):
         pred_color = COLORS['danger'] if prediction['prediction'] == 1 else COLORS['success']
         self.prediction_label.config(text=f"Prediction: {pred_text}", fg=pred_color)
         
-        risk_colors = {'HIGH': COLORS['danger'], 'MODERATE': COLORS['warning'], 'LOW': COLORS['success']}
         self.risk_label.config(
             text=f"Risk Level: {prediction['risk_level']}",
-            fg=risk_colors.get(prediction['risk_level'], COLORS['text_secondary'])
+            fg=COLORS[_RISK_COLOR_KEYS.get(prediction['risk_level'], 'text_secondary')]
         )
         
         # Top factors
@@ -447,7 +581,7 @@ class PredictPage(BasePage):
             self.factors_label.config(text="Top factors:\n" + "\n".join(factors))
         
         # Chart
-        self.bar_chart.draw_bars(explanation['all_features'])
+        self.bar_chart.draw_bars(explanation['all_features'][:self.bar_chart.MAX_BARS])
         
         # Calculate and display ROI impact
         prob = prediction['churn_probability']
@@ -500,80 +634,38 @@ class PredictPage(BasePage):
     
     def load_high_risk(self):
         """Load random high-risk sample (month-to-month, fiber optic, no add-ons)."""
-        sample = {
-            'gender': random.choice(['Male', 'Female']),
-            'SeniorCitizen': random.choice(['No', 'Yes']),
-            'Partner': 'No',
-            'Dependents': 'No',
-            'tenure': random.randint(1, 6),
-            'PhoneService': 'Yes',
-            'MultipleLines': random.choice(['No', 'Yes']),
-            'InternetService': 'Fiber optic',
-            'OnlineSecurity': 'No',
-            'OnlineBackup': 'No',
-            'DeviceProtection': 'No',
-            'TechSupport': 'No',
-            'StreamingTV': random.choice(['No', 'Yes']),
-            'StreamingMovies': random.choice(['No', 'Yes']),
-            'Contract': 'Month-to-month',
-            'PaperlessBilling': 'Yes',
-            'PaymentMethod': 'Electronic check',
-            'MonthlyCharges': round(random.uniform(65.0, 100.0), 2),
-            'TotalCharges': round(random.uniform(50.0, 500.0), 2)
-        }
+        sample = dict(
+            _HIGH_RISK,
+            gender=random.choice(_GENDERS),
+            SeniorCitizen=random.choice(_YES_NO),
+            tenure=random.randint(1, 6),
+            MultipleLines=random.choice(_YES_NO),
+            StreamingTV=random.choice(_YES_NO),
+            StreamingMovies=random.choice(_YES_NO),
+            MonthlyCharges=round(random.uniform(65.0, 100.0), 2),
+            TotalCharges=round(random.uniform(50.0, 500.0), 2)
+        )
         for key, value in sample.items():
             self.inputs[key].set(value)
+        self.after_idle(self._prefetch_predict)
     
     def load_low_risk(self):
         """Load random low-risk sample (two-year contract, DSL, with add-ons)."""
-        sample = {
-            'gender': random.choice(['Male', 'Female']),
-            'SeniorCitizen': 'No',
-            'Partner': 'Yes',
-            'Dependents': 'Yes',
-            'tenure': random.randint(40, 72),
-            'PhoneService': 'Yes',
-            'MultipleLines': 'Yes',
-            'InternetService': 'DSL',
-            'OnlineSecurity': 'Yes',
-            'OnlineBackup': 'Yes',
-            'DeviceProtection': 'Yes',
-            'TechSupport': 'Yes',
-            'StreamingTV': 'Yes',
-            'StreamingMovies': 'Yes',
-            'Contract': 'Two year',
-            'PaperlessBilling': 'No',
-            'PaymentMethod': random.choice(['Bank transfer (automatic)', 'Credit card (automatic)']),
-            'MonthlyCharges': round(random.uniform(70.0, 100.0), 2),
-            'TotalCharges': round(random.uniform(4000.0, 8000.0), 2)
-        }
+        sample = dict(
+            _LOW_RISK,
+            gender=random.choice(_GENDERS),
+            tenure=random.randint(40, 72),
+            PaymentMethod=random.choice(_AUTO_PAYMENTS),
+            MonthlyCharges=round(random.uniform(70.0, 100.0), 2),
+            TotalCharges=round(random.uniform(4000.0, 8000.0), 2)
+        )
         for key, value in sample.items():
             self.inputs[key].set(value)
+        self.after_idle(self._prefetch_predict)
     
     def clear_all(self):
         """Clear all inputs and results."""
-        defaults = {
-            'gender': 'Male',
-            'SeniorCitizen': 'No',
-            'Partner': 'No',
-            'Dependents': 'No',
-            'tenure': 12,
-            'PhoneService': 'Yes',
-            'MultipleLines': 'No',
-            'InternetService': 'Fiber optic',
-            'OnlineSecurity': 'No',
-            'OnlineBackup': 'No',
-            'DeviceProtection': 'No',
-            'TechSupport': 'No',
-            'StreamingTV': 'No',
-            'StreamingMovies': 'No',
-            'Contract': 'Month-to-month',
-            'PaperlessBilling': 'Yes',
-            'PaymentMethod': 'Electronic check',
-            'MonthlyCharges': 50.0,
-            'TotalCharges': 600.0
-        }
-        for key, value in defaults.items():
+        for key, value in _DEFAULTS:
             self.inputs[key].set(value)
         
         self.gauge.reset()
@@ -613,8 +705,7 @@ class PredictPage(BasePage):
             return
 
         risk_level = rec.get('risk_level', 'LOW')
-        risk_colors_map = {'HIGH': COLORS['danger'], 'MODERATE': COLORS['warning'], 'LOW': COLORS['success']}
-        risk_color = risk_colors_map.get(risk_level, COLORS['accent'])
+        risk_color = COLORS[_RISK_COLOR_KEYS.get(risk_level, 'accent')]
 
         # ── Create dialog window ────────────────────────────────────
         dialog = tk.Toplevel(self)
@@ -638,8 +729,7 @@ class PredictPage(BasePage):
         header.pack_propagate(False)
 
         prob_pct = rec.get('churn_probability', 0) * 100
-        risk_icons = {'HIGH': '🚨', 'MODERATE': '⚠️', 'LOW': '✅'}
-        icon = risk_icons.get(risk_level, '📋')
+        icon = _RISK_ICONS.get(risk_level, '📋')
 
         tk.Label(
             header,
@@ -707,13 +797,28 @@ class PredictPage(BasePage):
         text_widget.tag_configure('gen_action', font=('Segoe UI', 11),
                                   foreground=COLORS['text_primary'], lmargin1=15, lmargin2=30,
                                   spacing1=4, spacing3=4)
+        text_widget.tag_configure('roi_title', font=('Segoe UI', 13, 'bold'),
+                                  foreground=COLORS['success'], spacing1=12, spacing3=6)
+        text_widget.tag_configure('roi_value', font=('Segoe UI', 16, 'bold'),
+                                  foreground=COLORS['success'], justify='center',
+                                  spacing1=6, spacing3=4)
+        text_widget.tag_configure('roi_detail', font=('Segoe UI', 10),
+                                  foreground=COLORS['text_secondary'], lmargin1=15, lmargin2=15,
+                                  spacing1=2, spacing3=2)
+        text_widget.tag_configure('roi_cite', font=('Segoe UI', 9, 'italic'),
+                                  foreground=COLORS['text_muted'], lmargin1=15,
+                                  spacing1=8, spacing3=4)
 
         # ── Write content ───────────────────────────────────────────
+        # Collected as (text, tag) pairs and inserted with one call
+        parts = []
+        add = parts.append
+
         factor_insights = rec.get('factor_insights', [])
         # Limit to top 5 insights only
         top_insights = factor_insights[:5]
 
-        text_widget.insert(tk.END, f"🎯  Retention Strategy ({len(top_insights)} Key Actions)\n", 'section_title')
+        add((f"🎯  Retention Strategy ({len(top_insights)} Key Actions)\n", 'section_title'))
 
         if top_insights:
             for i, insight in enumerate(top_insights):
@@ -722,61 +827,50 @@ class PredictPage(BasePage):
 
                 # Number + badges line
                 num_tag = 'card_num_top' if is_top else 'card_num'
-                text_widget.insert(tk.END, f"  {i+1}. ", num_tag)
+                add((f"  {i+1}. ", num_tag))
 
                 if is_top:
-                    text_widget.insert(tk.END, " TOP FACTOR ", 'top_badge')
-                    text_widget.insert(tk.END, "  ")
+                    add((" TOP FACTOR ", 'top_badge'))
+                    add(("  ", ''))
 
                 if shap_pct > 0:
-                    text_widget.insert(tk.END, f" Impact: {shap_pct:.1f}% ", 'impact_badge')
+                    add((f" Impact: {shap_pct:.1f}% ", 'impact_badge'))
 
-                text_widget.insert(tk.END, "\n")
+                add(("\n", ''))
 
                 # Problem (why)
                 reason_text = insight.get('reason', '')
-                text_widget.insert(tk.END, f"Problem: {reason_text}\n", 'reason_text')
+                add((f"Problem: {reason_text}\n", 'reason_text'))
 
                 # Solution (action)
                 action_text = insight.get('action', '')
-                text_widget.insert(tk.END, f"→ Solution: {action_text}\n", 'action_text')
+                add((f"→ Solution: {action_text}\n", 'action_text'))
 
                 # Thin separator
-                text_widget.insert(tk.END, "─" * 60 + "\n", 'separator')
+                add(("─" * 60 + "\n", 'separator'))
         else:
-            text_widget.insert(tk.END, "No specific risk factors detected for this customer.\n\n",
-                               'reason_text')
+            add(("No specific risk factors detected for this customer.\n\n", 'reason_text'))
 
         # ── ROI Business Impact section ──────────────────────────────
-        text_widget.tag_configure('roi_title', font=('Segoe UI', 13, 'bold'),
-                                  foreground=COLORS['success'], spacing1=12, spacing3=6)
-        text_widget.tag_configure('roi_value', font=('Segoe UI', 16, 'bold'),
-                                  foreground=COLORS['success'], justify='center',
-                                  spacing1=6, spacing3=4)
-        text_widget.tag_configure('roi_detail', font=('Segoe UI', 10),
-                                  foreground=COLORS['text_secondary'], lmargin1=15, lmargin2=15,
-                                  spacing1=2, spacing3=2)
-        text_widget.tag_configure('roi_cite', font=('Segoe UI', 9, 'italic'),
-                                  foreground=COLORS['text_muted'], lmargin1=15,
-                                  spacing1=8, spacing3=4)
-
-        text_widget.insert(tk.END, "\n💰  ROI Business Impact\n", 'roi_title')
+        add(("\n💰  ROI Business Impact\n", 'roi_title'))
 
         prob_pct_val = rec.get('churn_probability', 0) * 100
         if prob_pct_val >= 50:  # Predicted churner
             net_value = self.CLV_BENEFIT - self.CAMPAIGN_COST
-            text_widget.insert(tk.END, f"      +${net_value} net value per customer\n", 'roi_value')
-            text_widget.insert(tk.END, f"  • CLV saved if retained: ${self.CLV_BENEFIT}\n", 'roi_detail')
-            text_widget.insert(tk.END, f"  • Retention campaign cost: ${self.CAMPAIGN_COST}\n", 'roi_detail')
-            text_widget.insert(tk.END, f"  • Net ROI per customer: ${net_value}\n", 'roi_detail')
-            text_widget.insert(tk.END, f"  • Formula: ROI = (TP × ${self.CLV_BENEFIT}) − (FP × ${self.CAMPAIGN_COST})\n", 'roi_detail')
-            text_widget.insert(tk.END, f"  • Model-wide ROI: $132,000 (339 TPs × ${self.CLV_BENEFIT} − 411 FPs × ${self.CAMPAIGN_COST})\n", 'roi_detail')
+            add((f"      +${net_value} net value per customer\n", 'roi_value'))
+            add((f"  • CLV saved if retained: ${self.CLV_BENEFIT}\n", 'roi_detail'))
+            add((f"  • Retention campaign cost: ${self.CAMPAIGN_COST}\n", 'roi_detail'))
+            add((f"  • Net ROI per customer: ${net_value}\n", 'roi_detail'))
+            add((f"  • Formula: ROI = (TP × ${self.CLV_BENEFIT}) − (FP × ${self.CAMPAIGN_COST})\n", 'roi_detail'))
+            add((f"  • Model-wide ROI: $132,000 (339 TPs × ${self.CLV_BENEFIT} − 411 FPs × ${self.CAMPAIGN_COST})\n", 'roi_detail'))
         else:  # Low risk
-            text_widget.insert(tk.END, "      $0 — No retention action needed\n", 'roi_value')
-            text_widget.insert(tk.END, "  • Customer is low risk — no campaign spend required\n", 'roi_detail')
-            text_widget.insert(tk.END, f"  • Unnecessary retention offer would cost ${self.CAMPAIGN_COST}\n", 'roi_detail')
+            add(("      $0 — No retention action needed\n", 'roi_value'))
+            add(("  • Customer is low risk — no campaign spend required\n", 'roi_detail'))
+            add((f"  • Unnecessary retention offer would cost ${self.CAMPAIGN_COST}\n", 'roi_detail'))
+
+        add(("\n  Based on profit-driven framework (De Caigny et al., 2018)\n", 'roi_cite'))
 
-        text_widget.insert(tk.END, "\n  Based on profit-driven framework (De Caigny et al., 2018)\n", 'roi_cite')
+        text_widget.insert(tk.END, *[item for part in parts for item in part])
 
         # Make read-only
         text_widget.config(state=tk.DISABLED)
@@ -4,48 +4,85 @@ PDF report generation interface using prediction results.
 """
 
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog
 from .base import BasePage
-import sys
 import os
+import threading
+import queue
+import collections
+import functools
 from datetime import datetime
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from theme import COLORS, FONTS, ICONS
-from components.widgets import ModernButton
+from components.widgets import ModernButton, suspended_layout
+
+@functools.lru_cache(maxsize=1)
+def _get_generator_class():
+    """Import ChurnReportGenerator (and reportlab) on first use, then reuse it."""
+    from report_generator import ChurnReportGenerator
+    return ChurnReportGenerator
 
 
 class ReportsPage(BasePage):
     """Page for generating PDF reports from prediction results."""
     
+    # Number of reports listed under Recent Reports
+    MAX_RECENT_REPORTS = 5
+    
     def __init__(self, parent, controller, **kwargs):
         super().__init__(parent, controller, **kwargs)
-        self.generated_reports = []
+        self.generated_reports = collections.deque(maxlen=self.MAX_RECENT_REPORTS)
+        # Banner is built in its "no data" state
+        self._status_shown = None
+        self._result_queue = queue.Queue()
+        self._preview_cache = {}
+        self._cached_data = None
+        self._progress = (0, 0)
+        self._cancel_event = threading.Event()
+        # True from starting a report worker until its result is received
+        self._generating = False
+        self._dialog_result = False
+        # Start the save dialog somewhere cheap to list instead of the CWD
+        documents = os.path.expanduser('~/Documents')
+        self._last_save_dir = documents if os.path.isdir(documents) else os.path.expanduser('~')
         self.setup_page()
     
     def setup_page(self):
         """Setup the reports page."""
-        # Header
-        self.create_header(
-            "Reports",
-            "Generate and export PDF reports from prediction results"
-        )
-        
-        # Main content
-        main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
-        
-        # Data status banner
-        self.create_data_status(main_frame)
-        
-        # Report types
-        self.create_report_options(main_frame)
-        
-        # Report settings
-        self.create_report_settings(main_frame)
-        
-        # Recent reports
-        self.create_recent_reports(main_frame)
+        # Shared radio/check button colors, set once instead of per widget;
+        # the option database is app-wide, so patterns are scoped to this page
+        page = f'*{self.winfo_name()}*'
+        self.option_add(page + 'Radiobutton.selectColor', COLORS['bg_medium'])
+        self.option_add(page + 'Radiobutton.activeBackground', COLORS['bg_light'])
+        self.option_add(page + 'Radiobutton.activeForeground', COLORS['text_primary'])
+        self.option_add(page + 'Checkbutton.selectColor', COLORS['bg_medium'])
+        self.option_add(page + 'Checkbutton.activeBackground', COLORS['bg_card'])
+        self.option_add(page + 'Checkbutton.activeForeground', COLORS['text_primary'])
+        
+        # Detach the scroll container while the page is built so the whole
+        # tree (including the report option rows) is laid out in one pass
+        with suspended_layout(self.scrollable):
+            # Header
+            self.create_header(
+                "Reports",
+                "Generate and export PDF reports from prediction results"
+            )
+            
+            # Main content
+            main_frame = tk.Frame(self.content, bg=COLORS['bg_medium'])
+            main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=(0, 20))
+            
+            # Data status banner
+            self.create_data_status(main_frame)
+            
+            # Report types
+            self.create_report_options(main_frame)
+            
+            # Report settings
+            self.create_report_settings(main_frame)
+            
+            # Recent reports
+            self.create_recent_reports(main_frame)
     
     def create_data_status(self, parent):
         """Create data status banner."""
@@ -122,38 +159,30 @@ class ReportsPage(BasePage):
             value=value,
             font=FONTS['body_bold'],
             bg=COLORS['bg_light'],
-            fg=COLORS['text_primary'],
-            selectcolor=COLORS['bg_medium'],
-            activebackground=COLORS['bg_light'],
-            activeforeground=COLORS['text_primary']
+            fg=COLORS['text_primary']
         )
         rb.pack(anchor=tk.W)
         
-        tk.Label(
+        desc_label = tk.Label(
             inner, text=description,
             font=FONTS['small'],
             bg=COLORS['bg_light'],
             fg=COLORS['text_secondary']
-        ).pack(anchor=tk.W, padx=(20, 0))
+        )
+        desc_label.pack(anchor=tk.W, padx=(20, 0))
+        
+        # Hover effect (recolors a fixed widget list, no child lookups)
+        recolor_targets = (frame, inner, rb, desc_label)
         
-        # Hover effect
         def on_enter(e):
-            frame.config(bg=COLORS['sidebar_hover'])
-            inner.config(bg=COLORS['sidebar_hover'])
-            for child in inner.winfo_children():
-                try:
-                    child.config(bg=COLORS['sidebar_hover'])
-                except:
-                    pass
+            color = COLORS['sidebar_hover']
+            for widget in recolor_targets:
+                widget.configure(bg=color)
         
         def on_leave(e):
-            frame.config(bg=COLORS['bg_light'])
-            inner.config(bg=COLORS['bg_light'])
-            for child in inner.winfo_children():
-                try:
-                    child.config(bg=COLORS['bg_light'])
-                except:
-                    pass
+            color = COLORS['bg_light']
+            for widget in recolor_targets:
+                widget.configure(bg=color)
         
         for widget in [frame, inner]:
             widget.bind('<Enter>', on_enter)
@@ -192,10 +221,7 @@ class ReportsPage(BasePage):
                 variable=var,
                 font=FONTS['body'],
                 bg=COLORS['bg_card'],
-                fg=COLORS['text_primary'],
-                selectcolor=COLORS['bg_medium'],
-                activebackground=COLORS['bg_card'],
-                activeforeground=COLORS['text_primary']
+                fg=COLORS['text_primary']
             )
             cb.pack(anchor=tk.W, pady=3)
         
@@ -213,6 +239,13 @@ class ReportsPage(BasePage):
             btn_frame, "Preview Report", self.preview_report,
             style='secondary', icon="👁️", colors=COLORS
         ).pack(side=tk.LEFT)
+        
+        # Progress and cancel, packed only while a report is generating
+        self.cancel_btn = ModernButton(
+            btn_frame, "Cancel", self.cancel_report,
+            style='secondary', icon="✖", colors=COLORS
+        )
+        self.progress_bar = ttk.Progressbar(btn_frame, mode='determinate', length=180)
     
     def create_recent_reports(self, parent):
         """Create recent reports section."""
@@ -240,8 +273,56 @@ class ReportsPage(BasePage):
             justify=tk.CENTER
         )
         self.no_reports_label.pack(expand=True)
+        
+        # Pool of report rows, filled in by update_recent_reports
+        self._recent_rows = [self.create_recent_row() for _ in range(self.MAX_RECENT_REPORTS)]
+    
+    def create_recent_row(self):
+        """Create an (unpacked) recent report row; returns (row, name, time, open) widgets."""
+        row = tk.Frame(self.reports_container, bg=COLORS['bg_light'])
+        
+        inner = tk.Frame(row, bg=COLORS['bg_light'], padx=10, pady=8)
+        inner.pack(fill=tk.X)
+        
+        name_label = tk.Label(
+            inner,
+            font=FONTS['body_bold'],
+            bg=COLORS['bg_light'],
+            fg=COLORS['text_primary']
+        )
+        name_label.pack(side=tk.LEFT)
+        
+        time_label = tk.Label(
+            inner,
+            font=FONTS['small'],
+            bg=COLORS['bg_light'],
+            fg=COLORS['text_muted']
+        )
+        time_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Open button (reads the path stored on it when clicked)
+        open_btn = tk.Label(
+            inner, text="📂 Open",
+            font=FONTS['small'],
+            bg=COLORS['bg_light'],
+            fg=COLORS['accent'],
+            cursor='hand2'
+        )
+        open_btn.pack(side=tk.RIGHT)
+        open_btn._path = None
+        open_btn.bind('<Button-1>', self._on_open_click)
+        
+        return row, name_label, time_label, open_btn
+    
+    def _on_open_click(self, event):
+        """Open the report behind a recent report row."""
+        self.open_report(event.widget._path)
     
     def get_prediction_data(self):
+        """Get the prediction data captured when the page was shown."""
+        return self._cached_data
+    
+    def _fetch_prediction_data(self):
         """Get prediction data from upload_result page."""
         upload_result_page = self.controller.pages.get('upload_result')
         if upload_result_page and upload_result_page.result_data is not None:
@@ -251,6 +332,14 @@ class ReportsPage(BasePage):
     def update_data_status(self):
         """Update the data status banner based on available prediction data."""
         data = self.get_prediction_data()
+        self.generate_btn.config(state=tk.DISABLED if data is None or self._generating else tk.NORMAL)
+        
+        # The banner mixes emoji and text; only reconfigure (and re-shape)
+        # it when the status it shows has actually changed
+        status = None if data is None else len(data)
+        if status == self._status_shown:
+            return
+        self._status_shown = status
         
         if data is not None:
             # Data available
@@ -263,7 +352,6 @@ class ReportsPage(BasePage):
                 fg=COLORS['text_primary']
             )
             self.goto_upload_btn.pack_forget()
-            self.generate_btn.config(state=tk.NORMAL)
         else:
             # No data
             self.status_card.config(bg=COLORS['bg_light'])
@@ -275,12 +363,22 @@ class ReportsPage(BasePage):
                 fg=COLORS['text_secondary']
             )
             self.goto_upload_btn.pack(side=tk.RIGHT)
-            self.generate_btn.config(state=tk.DISABLED)
     
     def on_show(self):
         """Called when page is shown."""
+        # One lookup per visit, shared by the banner, preview and generate
+        data = self._cached_data = self._fetch_prediction_data()
+        
+        # Drop preview counts computed for an older prediction table
+        if data is None or (id(data), len(data)) not in self._preview_cache:
+            self._preview_cache.clear()
         self.update_data_status()
     
+    def on_hide(self):
+        """Called when page is hidden."""
+        # Re-read on the next visit in case predictions were re-run
+        self._cached_data = None
+    
     def go_to_upload(self):
         """Navigate to upload page."""
         self.controller.show_page('upload')
@@ -300,23 +398,37 @@ class ReportsPage(BasePage):
             'batch': 'Batch Predictions Report'
         }
         
-        # Calculate stats for preview
-        total = len(data)
-        high_risk = len(data[data['risk_level'] == 'HIGH'])
-        moderate_risk = len(data[data['risk_level'] == 'MODERATE'])
-        low_risk = len(data[data['risk_level'] == 'LOW'])
-        churn_count = len(data[data['prediction'] == 'Churn'])
-        churn_rate = (churn_count / total * 100) if total > 0 else 0
+        # Calculate stats for preview (one pass per column, cached per table)
+        key = (id(data), len(data))
+        stats = self._preview_cache.get(key)
+        if stats is None:
+            risk_counts = data['risk_level'].value_counts()
+            stats = self._preview_cache[key] = {
+                'total': len(data),
+                'high': int(risk_counts.get('HIGH', 0)),
+                'moderate': int(risk_counts.get('MODERATE', 0)),
+                'low': int(risk_counts.get('LOW', 0)),
+                'churn': int((data['prediction'].values == 'Churn').sum()),
+            }
+        
+        total = stats['total']
+        high_risk = stats['high']
+        moderate_risk = stats['moderate']
+        low_risk = stats['low']
+        churn_count = stats['churn']
+        
+        # Percent scale, guarded once for an empty table
+        scale = 100 / total if total > 0 else 0
         
         preview_text = f"""
 Report Preview: {report_names.get(report_type, 'Report')}
 
 📊 Data Summary:
 • Total Customers: {total}
-• High Risk: {high_risk} ({high_risk/total*100:.1f}%)
-• Moderate Risk: {moderate_risk} ({moderate_risk/total*100:.1f}%)
-• Low Risk: {low_risk} ({low_risk/total*100:.1f}%)
-• Predicted Churn: {churn_count} ({churn_rate:.1f}%)
+• High Risk: {high_risk} ({high_risk * scale:.1f}%)
+• Moderate Risk: {moderate_risk} ({moderate_risk * scale:.1f}%)
+• Low Risk: {low_risk} ({low_risk * scale:.1f}%)
+• Predicted Churn: {churn_count} ({churn_count * scale:.1f}%)
 
 📄 Report will include:
 • Charts: {'Yes' if self.include_charts.get() else 'No'}
@@ -330,6 +442,9 @@ Click 'Generate & Save PDF' to create the report.
     
     def generate_report(self):
         """Generate the selected report."""
+        if self._generating:
+            return
+        
         data = self.get_prediction_data()
         if data is None:
             messagebox.showwarning("No Data", "Please upload and process data first.")
@@ -351,17 +466,41 @@ Click 'Generate & Save PDF' to create the report.
             title="Save Report as PDF",
             defaultextension=".pdf",
             filetypes=[("PDF files", "*.pdf")],
-            initialfile=default_filename
+            initialfile=default_filename,
+            initialdir=self._last_save_dir,
+            confirmoverwrite=True
         )
         
         if not file_path:
             return
         
+        self._last_save_dir = os.path.dirname(file_path)
+        
+        # Read the Tk variables here; the worker must not touch Tk
+        include_charts = self.include_charts.get()
+        include_recommendations = self.include_recommendations.get()
+        
+        self._generating = True
+        self.generate_btn.config(state=tk.DISABLED)
+        self._progress = (0, 0)
+        self._cancel_event.clear()
+        self.progress_bar.config(value=0, maximum=1)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.cancel_btn.pack(side=tk.RIGHT)
+        self.progress_bar.pack(side=tk.RIGHT, padx=(0, 10))
+        
+        threading.Thread(
+            target=self._generate_worker,
+            args=(data, report_type, file_path, include_charts, include_recommendations),
+            daemon=True
+        ).start()
+        self.after(100, self._poll_result)
+    
+    def _generate_worker(self, data, report_type, file_path, include_charts, include_recommendations):
+        """Build the PDF off the Tk thread and queue the outcome."""
+        fh = None
         try:
-            # Import report generator
-            ui_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            sys.path.insert(0, ui_dir)
-            from report_generator import ChurnReportGenerator
+            generator_class = _get_generator_class()
             
             # Correct model info (XGBoost - best model by ROC-AUC)
             model_info = {
@@ -375,38 +514,132 @@ Click 'Generate & Save PDF' to create the report.
             }
             
             # Create generator with settings
-            generator = ChurnReportGenerator(
+            generator = generator_class(
                 data,
                 model_info=model_info,
-                include_charts=self.include_charts.get(),
-                include_recommendations=self.include_recommendations.get()
+                include_charts=include_charts,
+                include_recommendations=include_recommendations,
+                progress_callback=self._set_progress,
+                cancel_event=self._cancel_event
             )
             
-            # Generate appropriate report
-            if report_type == 'summary':
-                generator.generate_summary_report(file_path)
-            elif report_type == 'customer':
-                generator.generate_customer_analysis_report(file_path)
-            elif report_type == 'model':
-                generator.generate_model_performance_report(file_path)
-            elif report_type == 'batch':
-                generator.generate_batch_predictions_report(file_path)
-            
-            # Add to recent reports
-            self.add_recent_report(report_type, file_path)
-            
-            # Success message
-            messagebox.showinfo(
-                "Report Generated",
-                f"Report saved successfully!\n\nFile: {os.path.basename(file_path)}\nLocation: {os.path.dirname(file_path)}"
-            )
+            # Generate appropriate report, written through one buffered handle
+            fh = open(file_path, 'wb', buffering=1024 * 1024)
+            with fh:
+                if report_type == 'summary':
+                    generator.generate_summary_report(fh)
+                elif report_type == 'customer':
+                    generator.generate_customer_analysis_report(fh)
+                elif report_type == 'model':
+                    generator.generate_model_performance_report(fh)
+                elif report_type == 'batch':
+                    generator.generate_batch_predictions_report(fh)
             
-            # Ask to open
-            if messagebox.askyesno("Open Report", "Would you like to open the report now?"):
-                os.startfile(file_path)
-                
+            self._result_queue.put(('ok', report_type, file_path))
+        except Exception as e:
+            # Don't leave a half-written PDF behind
+            if fh is not None:
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            status = 'cancelled' if self._cancel_event.is_set() else 'err'
+            self._result_queue.put((status, report_type, str(e)))
+    
+    def _set_progress(self, done, total):
+        """Record generation progress (called on the worker thread)."""
+        self._progress = (done, total)
+    
+    def cancel_report(self):
+        """Ask the running report worker to stop."""
+        self._cancel_event.set()
+        self.cancel_btn.config(state=tk.DISABLED)
+    
+    def _poll_result(self):
+        """Check for a finished report, updating progress until one arrives."""
+        try:
+            status, report_type, payload = self._result_queue.get_nowait()
+        except queue.Empty:
+            done, total = self._progress
+            if total:
+                self.progress_bar.config(value=done, maximum=total)
+            self.after(100, self._poll_result)
+            return
+        
+        self._generating = False
+        self.progress_bar.pack_forget()
+        self.cancel_btn.pack_forget()
+        self.update_data_status()
+        
+        if status == 'cancelled':
+            return
+        
+        if status == 'err':
+            messagebox.showerror("Error", f"Failed to generate report:\n{payload}")
+            return
+        
+        file_path = payload
+        
+        # Add to recent reports
+        self.add_recent_report(report_type, file_path)
+        
+        # Success message with the option to open, in one dialog
+        if self.show_report_saved(file_path):
+            self.open_report(file_path)
+    
+    def show_report_saved(self, file_path):
+        """Show the saved-report dialog; return True if the user chose to open it."""
+        self._dialog_result = False
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("Report Generated")
+        dialog.configure(bg=COLORS['bg_card'])
+        dialog.resizable(False, False)
+        dialog.transient(self.winfo_toplevel())
+        
+        tk.Label(
+            dialog,
+            text=f"Report saved successfully!\n\nFile: {os.path.basename(file_path)}\nLocation: {os.path.dirname(file_path)}",
+            font=FONTS['body'],
+            bg=COLORS['bg_card'],
+            fg=COLORS['text_primary'],
+            justify=tk.LEFT,
+            wraplength=420
+        ).pack(padx=25, pady=(20, 15), anchor=tk.W)
+        
+        btn_frame = tk.Frame(dialog, bg=COLORS['bg_card'])
+        btn_frame.pack(fill=tk.X, padx=25, pady=(0, 20))
+        
+        def choose(open_now):
+            self._dialog_result = open_now
+            dialog.destroy()
+        
+        ModernButton(
+            btn_frame, "Close", lambda: choose(False),
+            style='secondary', colors=COLORS
+        ).pack(side=tk.RIGHT)
+        ModernButton(
+            btn_frame, "Open", lambda: choose(True),
+            style='primary', icon="📂", colors=COLORS
+        ).pack(side=tk.RIGHT, padx=(0, 10))
+        
+        # Center over the main window
+        dialog.update_idletasks()
+        root = self.winfo_toplevel()
+        x = root.winfo_rootx() + (root.winfo_width() - dialog.winfo_width()) // 2
+        y = root.winfo_rooty() + (root.winfo_height() - dialog.winfo_height()) // 2
+        dialog.geometry(f"+{x}+{y}")
+        
+        dialog.grab_set()
+        dialog.wait_window()
+        return self._dialog_result
+    
+    def open_report(self, file_path):
+        """Open a report with the system viewer."""
+        try:
+            os.startfile(file_path)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate report:\n{str(e)}")
+            messagebox.showerror("Error", f"Could not open file:\n{file_path}\n\n{str(e)}")
     
     def add_recent_report(self, report_type, file_path):
         """Add a report to the recent reports list."""
@@ -417,70 +650,32 @@ Click 'Generate & Save PDF' to create the report.
             'batch': '📋 Batch Predictions'
         }
         
-        self.generated_reports.insert(0, {
+        # Newest first; the deque drops the oldest beyond MAX_RECENT_REPORTS
+        self.generated_reports.appendleft({
             'type': report_type,
             'name': report_names.get(report_type, 'Report'),
             'path': file_path,
             'time': datetime.now().strftime("%I:%M %p")
         })
         
-        # Keep only last 5
-        self.generated_reports = self.generated_reports[:5]
-        
         # Update display
         self.update_recent_reports()
     
     def update_recent_reports(self):
         """Update the recent reports display."""
-        # Clear container
-        for widget in self.reports_container.winfo_children():
-            widget.destroy()
-        
-        if not self.generated_reports:
-            self.no_reports_label = tk.Label(
-                self.reports_container,
-                text="No reports generated yet.",
-                font=FONTS['body'],
-                bg=COLORS['bg_card'],
-                fg=COLORS['text_muted']
-            )
+        if self.generated_reports:
+            self.no_reports_label.pack_forget()
+        else:
             self.no_reports_label.pack(expand=True)
-            return
         
-        for report in self.generated_reports:
-            row = tk.Frame(self.reports_container, bg=COLORS['bg_light'])
-            row.pack(fill=tk.X, pady=3)
-            
-            inner = tk.Frame(row, bg=COLORS['bg_light'], padx=10, pady=8)
-            inner.pack(fill=tk.X)
-            
-            tk.Label(
-                inner, text=report['name'],
-                font=FONTS['body_bold'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_primary']
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                inner, text=f"Generated at {report['time']}",
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_muted']
-            ).pack(side=tk.LEFT, padx=(10, 0))
-            
-            # Open button
-            def open_report(path=report['path']):
-                try:
-                    os.startfile(path)
-                except:
-                    messagebox.showerror("Error", f"Could not open file:\n{path}")
-            
-            open_btn = tk.Label(
-                inner, text="📂 Open",
-                font=FONTS['small'],
-                bg=COLORS['bg_light'],
-                fg=COLORS['accent'],
-                cursor='hand2'
-            )
-            open_btn.pack(side=tk.RIGHT)
-            open_btn.bind('<Button-1>', lambda e, p=report['path']: open_report(p))
+        # Reuse the pooled rows: retext the used ones, hide the rest
+        for i, (row, name_label, time_label, open_btn) in enumerate(self._recent_rows):
+            if i < len(self.generated_reports):
+                report = self.generated_reports[i]
+                name_label.config(text=report['name'])
+                time_label.config(text=f"Generated at {report['time']}")
+                open_btn._path = report['path']
+                if not row.winfo_manager():
+                    row.pack(fill=tk.X, pady=3)
+            elif row.winfo_manager():
+                row.pack_forget()
@@ -16,10 +16,19 @@ from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
 
+class ReportCancelled(Exception):
+    """Raised when report generation is cancelled through ``cancel_event``."""
+
+
 class ChurnReportGenerator:
-    """Generates PDF reports for churn prediction results."""
+    """Generates PDF reports for churn prediction results.
+    
+    The ``generate_*_report`` methods accept either a file path or a
+    binary file object opened for writing.
+    """
     
-    def __init__(self, prediction_data, model_info=None, include_charts=True, include_recommendations=True):
+    def __init__(self, prediction_data, model_info=None, include_charts=True, include_recommendations=True,
+                 progress_callback=None, cancel_event=None):
         """
         Initialize the report generator.
         
@@ -28,10 +37,16 @@ class ChurnReportGenerator:
             model_info: Optional dict with model performance metrics
             include_charts: Whether to include visualizations
             include_recommendations: Whether to include recommendations
+            progress_callback: Optional callable(done, total) called as
+                report elements are laid out
+            cancel_event: Optional threading.Event; when set, the build
+                stops with ReportCancelled
         """
         self.data = prediction_data
         self.include_charts = include_charts
         self.include_recommendations = include_recommendations
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
         self.model_info = model_info or {
             'name': 'XGBoost',
             'accuracy': 68.35,
@@ -566,6 +581,23 @@ class ChurnReportGenerator:
         
         return elements
     
+    def _build(self, doc, elements):
+        """Build the document, reporting progress and checking for cancellation."""
+        total = len(elements)
+        done = 0
+        
+        def after_flowable(flowable):
+            nonlocal done
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise ReportCancelled()
+            # Split flowables (e.g. long tables) are reported more than once
+            done = min(done + 1, total)
+            if self.progress_callback is not None:
+                self.progress_callback(done, total)
+        
+        doc.afterFlowable = after_flowable
+        doc.build(elements)
+    
     def generate_summary_report(self, filepath):
         """Generate a summary report PDF."""
         doc = SimpleDocTemplate(
@@ -591,7 +623,7 @@ class ChurnReportGenerator:
         elements.extend(self._create_footer())
         
         # Build PDF
-        doc.build(elements)
+        self._build(doc, elements)
         return filepath
     
     def generate_customer_analysis_report(self, filepath):
@@ -662,11 +694,34 @@ class ChurnReportGenerator:
                 elements.append(Spacer(1, 15))
         
         elements.extend(self._create_footer())
-        doc.build(elements)
+        self._build(doc, elements)
         return filepath
     
-    def generate_batch_predictions_report(self, filepath):
-        """Generate a batch predictions report with all data."""
+    def _iter_row_batches(self, columns, chunk_size, max_rows):
+        """Yield (start, end, rows) batches of formatted table rows."""
+        total_rows = min(len(self.data), max_rows)
+        for start in range(0, total_rows, chunk_size):
+            end = min(start + chunk_size, total_rows)
+            rows = []
+            for _, row in self.data.iloc[start:end].iterrows():
+                row_data = []
+                for col in columns:
+                    val = row.get(col, 'N/A')
+                    if col == 'churn_probability_%':
+                        row_data.append(f"{val:.1f}%")
+                    elif col in ['tenure', 'SeniorCitizen']:
+                        row_data.append(str(int(val)) if val else 'N/A')
+                    else:
+                        row_data.append(str(val))
+                rows.append(row_data)
+            yield start, end, rows
+    
+    def generate_batch_predictions_report(self, filepath, chunk_size=40):
+        """Generate a batch predictions report with all data.
+        
+        Rows are formatted one batch of ``chunk_size`` at a time, and each
+        batch becomes its own table page.
+        """
         doc = SimpleDocTemplate(
             filepath,
             pagesize=letter,
@@ -685,34 +740,17 @@ class ChurnReportGenerator:
         elements.append(Paragraph(f"Total Records: {stats['total']}", self.styles['BodyTextCustom']))
         elements.append(Spacer(1, 10))
         
-        # Full data table (paginated, 40 per page)
+        # Full data table (paginated, chunk_size per page)
         columns = ['customerID', 'gender', 'Contract', 'InternetService', 'tenure', 'prediction', 'churn_probability_%', 'risk_level']
         display_cols = [col for col in columns if col in self.data.columns]
+        header = [col.replace('_', ' ').title() for col in display_cols]
+        col_widths = [0.7*inch, 0.5*inch, 0.7*inch, 1*inch, 0.8*inch, 1*inch, 0.8*inch][:len(display_cols)]
         
-        # Process in chunks
-        chunk_size = 40
         total_rows = len(self.data)
+        shown_rows = min(total_rows, 120)  # Max 3 pages of data
         
-        for start in range(0, min(total_rows, 120), chunk_size):  # Max 3 pages of data
-            end = min(start + chunk_size, total_rows)
-            chunk_df = self.data.iloc[start:end]
-            
-            table_data = [[col.replace('_', ' ').title() for col in display_cols]]
-            
-            for _, row in chunk_df.iterrows():
-                row_data = []
-                for col in display_cols:
-                    val = row.get(col, 'N/A')
-                    if col == 'churn_probability_%':
-                        row_data.append(f"{val:.1f}%")
-                    elif col in ['tenure', 'SeniorCitizen']:
-                        row_data.append(str(int(val)) if val else 'N/A')
-                    else:
-                        row_data.append(str(val))
-                table_data.append(row_data)
-            
-            col_widths = [0.7*inch, 0.5*inch, 0.7*inch, 1*inch, 0.8*inch, 1*inch, 0.8*inch][:len(display_cols)]
-            table = Table(table_data, colWidths=col_widths)
+        for start, end, rows in self._iter_row_batches(display_cols, chunk_size, shown_rows):
+            table = Table([header] + rows, colWidths=col_widths)
             table.setStyle(TableStyle([
                 ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f6feb')),
                 ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
@@ -729,7 +767,7 @@ class ChurnReportGenerator:
             elements.append(Spacer(1, 5))
             elements.append(Paragraph(f"Rows {start+1} - {end} of {total_rows}", self.styles['CenterText']))
             
-            if end < min(total_rows, 120):
+            if end < shown_rows:
                 elements.append(PageBreak())
         
         if total_rows > 120:
@@ -743,7 +781,7 @@ class ChurnReportGenerator:
         elements.extend(self._create_roi_section(stats))
         
         elements.extend(self._create_footer())
-        doc.build(elements)
+        self._build(doc, elements)
         return filepath
     
     def generate_model_performance_report(self, filepath):
@@ -868,5 +906,5 @@ class ChurnReportGenerator:
         elements.append(feat_table)
         
         elements.extend(self._create_footer())
-        doc.build(elements)
+        self._build(doc, elements)
         return filepath